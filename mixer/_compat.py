@@ -175,3 +175,26 @@ except ImportError:
             name = _resolve_name(name[level:], package, level)
         __import__(name)
         return sys.modules[name]
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    import threading
+
+    class ContextVar(threading.local):
+
+        """ A thread-local replacement of `contextvars.ContextVar`. """
+
+        def __init__(self, name, default=None):
+            self.name = name
+            self.value = default
+
+        def get(self):
+            return self.value
+
+        def set(self, value):
+            token, self.value = self.value, value
+            return token
+
+        def reset(self, token):
+            self.value = token
@@ -1,12 +1,20 @@
 """ Integrate Faker to the Mixer. """
 import decimal as dc
 import locale as pylocale
-from collections import defaultdict
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from importlib import import_module
+from random import Random
 
 from faker import Factory, Generator
+from faker.generator import random as RANDOM
 from faker.config import DEFAULT_LOCALE, AVAILABLE_LOCALES, PROVIDERS
 from faker.providers import BaseProvider
 
+from . import _compat as _
+
 SMALLINT = 32768  # Safe in most databases according to Django docs
 
 GENRES = ('general', 'pop', 'dance', 'traditional', 'rock', 'alternative', 'rap', 'country',
@@ -15,25 +23,122 @@ GENRES = ('general', 'pop', 'dance', 'traditional', 'rock', 'alternative', 'rap'
           'mystery', 'romance', 'sport', 'thriller', 'war', 'western', 'fiction', 'epic',
           'tragedy', 'parody', 'pastoral', 'culture', 'art', 'dance', 'drugs', 'social')
 
+# Masks of UUID's version and variant bits
+UUID_VERSION = 0xf000 << 64
+UUID_VARIANT = 0xc000 << 48
+UUID_RFC_4122 = 0x8000 << 48
+
+# Provider classes of locales: {(provider, locale): (class, locale found)}
+PROVIDER_CLASSES = dict()
+
+# Names of the providers' methods: {(providers, locale): names}
+PROVIDER_NAMES = dict()
+LOCK = threading.RLock()
+
+
+class _Streams(threading.local):
+
+    """ Random streams of threads.
+
+    The main thread uses the faker's random. Other threads get their own
+    `random.Random` seeded from it, so threads don't share a random state
+    and `faker.seed()` keeps generation reproducible.
+
+    """
+
+    def __init__(self):
+        if isinstance(threading.current_thread(), threading._MainThread):
+            self.random = RANDOM
+        else:
+            with LOCK:
+                self.random = Random(RANDOM.getrandbits(64))
+
+
+STREAMS = _Streams()
+
+
+def _get_random(generator):
+    """ Get the random of the current thread (or the generator's own seeded random). """
+    random = generator._Generator__random
+    return STREAMS.random if random is RANDOM else random
+
+
+def get_provider_class(name, locale):
+    """ Find a provider's class of the locale (search the modules once).
+
+    :return tuple: (class, locale found)
+
+    """
+    key = name, locale
+    if key not in PROVIDER_CLASSES:
+        PROVIDER_CLASSES[key] = Factory._get_provider_class(name, locale)
+    return PROVIDER_CLASSES[key]
+
+
+def get_provider_names(providers, locale=None):
+    """ Get names of the providers' methods (the mixer's ones included).
+
+    Without a locale the base classes are used, their modules are imported
+    by faker already.
+
+    :return frozenset:
+
+    """
+    key = tuple(providers), locale
+    if key not in PROVIDER_NAMES:
+        classes = [MixerProvider] + [
+            get_provider_class(pname, locale)[0] if locale else import_module(pname).Provider
+            for pname in providers]
+        PROVIDER_NAMES[key] = frozenset(
+            name for cls in classes for name in dir(cls)
+            if not name.startswith('_') and callable(getattr(cls, name)))
+    return PROVIDER_NAMES[key]
+
 
 class MixerProvider(BaseProvider):
 
     """ Implement some mixer methods. """
 
-    def __init__(self, generator):
+    def __init__(self, generator, locale=DEFAULT_LOCALE):
         self.providers = []
         self.generator = generator
+        self.locale = locale
+        self.loaded = False
+
+        # A dispatch table of bound provider's methods
+        self.methods = dict(
+            (name, getattr(self, name)) for name in dir(type(self))
+            if not name.startswith('_') and callable(getattr(type(self), name))
+        )
+
+    def load(self, providers=PROVIDERS):
+        with LOCK:
+            if self.loaded:
+                return None
+
+            for pname in providers:
+                pcls, lang_found = get_provider_class(pname, self.locale)
+                provider = pcls(self.generator)
+                provider.__provider__ = pname
+                provider.__lang__ = lang_found
+                self.add_provider(provider)
+
+            self.loaded = True
+
+    def add_provider(self, provider):
+        self.providers.insert(0, provider)
+        for name in dir(provider):
+            if name.startswith('_'):
+                continue
+
+            method = getattr(provider, name)
+            if callable(method):
+                self.set_formatter(name, method)
 
-    def load(self, providers=PROVIDERS, locale=None):
-        if locale is None:
-            locale = self.generator.locale
-
-        for pname in providers:
-            pcls, lang_found = Factory._get_provider_class(pname, locale)
-            provider = pcls(self.generator)
-            provider.__provider__ = pname
-            provider.__lang__ = lang_found
-            self.generator.add_provider(provider)
+    def set_formatter(self, name, method):
+        if not hasattr(self, name):
+            setattr(self, name, method)
+            self.methods[name] = method
 
     def big_integer(self):
         """ Get a big integer.
@@ -75,10 +180,52 @@ class MixerProvider(BaseProvider):
         """ Get a positive integer. """
         return self.random_int(0, max=max)  # noqa
 
-    @staticmethod
-    def uuid():
-        import uuid
-        return str(uuid.uuid1())
+    def uuid(self, version=4, as_uuid=False):
+        """ Get a random UUID.
+
+        Values are generated from the faker's random, so they are reproducible
+        with a seed (except the timestamp of version 7) and don't leak the
+        host's details.
+
+        :param version: (4) UUID's version: 4 (random) or 7 (time-ordered)
+        :param as_uuid: (False) Return an `uuid.UUID` instead of a string
+
+        """
+        return self.uuids(1, version=version, as_uuid=as_uuid)[0]
+
+    def uuids(self, count, version=4, as_uuid=False):
+        """ Get a list of random UUIDs.
+
+        Random bits for all the values are taken at once.
+
+        :param count: Number of UUIDs
+        :param version: (4) UUID's version: 4 (random) or 7 (time-ordered)
+        :param as_uuid: (False) Return `uuid.UUID` instead of strings
+
+        """
+        if version not in (4, 7):
+            raise ValueError('Unsupported UUID version: %s' % version)
+
+        bits = '%0*x' % (count * 32, self.generator.random.getrandbits(count * 128))
+        flags = version << 76 | UUID_RFC_4122
+        mask = ~(UUID_VERSION | UUID_VARIANT)
+        if version == 7:
+            # 48 bits of the unix time in milliseconds go first
+            mask &= (1 << 80) - 1
+            flags |= int(time.time() * 1000) << 80
+
+        values = [int(bits[start:start + 32], 16) & mask | flags
+                  for start in range(0, count * 32, 32)]
+
+        if as_uuid:
+            return [uuid.UUID(int=value) for value in values]
+
+        results = []
+        for value in values:
+            value = '%032x' % value
+            results.append('%s-%s-%s-%s-%s' % (
+                value[:8], value[8:12], value[12:16], value[16:20], value[20:]))
+        return results
 
     def genre(self):
         return self.random_element(GENRES)
@@ -100,22 +247,126 @@ class MixerProvider(BaseProvider):
         return self.pystr(size).encode('utf-8')
 
 
+class LazyMethod(object):
+
+    """ A provider's method which is resolved when it's called first. """
+
+    __slots__ = 'generator', 'name'
+
+    def __init__(self, generator, name):
+        self.generator = generator
+        self.name = name
+
+    def __repr__(self):
+        return '<LazyMethod %s>' % self.name
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def resolve(self):
+        """ Load the providers and get the method. """
+        return getattr(self.generator.env, self.name)
+
+
+class LocaleGenerator(Generator):
+
+    """ A generator of a single locale.
+
+    Providers of the locale are bound to the generator, so their methods
+    which use other formatters don't depend on the current locale.
+    The random of the owner (:class:`MixerGenerator`) is used.
+
+    """
+
+    def __init__(self, locale=DEFAULT_LOCALE, providers=PROVIDERS, owner=None, **config):
+        super(LocaleGenerator, self).__init__(**config)
+        self.locale = locale
+        self.env = MixerProvider(self, locale)
+        self.owner = owner
+        self._providers = providers
+
+    @property
+    def random(self):
+        if self.owner is None:
+            return _get_random(self)
+        return self.owner.random
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        env = self.env
+        if not env.loaded:
+            env.load(self._providers)
+
+        try:
+            return env.methods[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def normalize_locale(locale):
+    """ Get a supported locale by a name ('ru', 'en-us', 'it_IT').
+
+    :return str:
+
+    """
+    locale = pylocale.normalize(locale.replace('-', '_')).split('.')[0]
+    if locale not in AVAILABLE_LOCALES:
+        return DEFAULT_LOCALE
+    return locale
+
+
 class MixerGenerator(Generator):
 
-    """ Support dynamic locales switch. """
+    """ Support dynamic locales switch.
+
+    Providers of a locale are loaded when the locale's methods are used first.
+    Every locale has a dispatch table of bound methods, so getting a method
+    is a single dict lookup.
+
+    The locale could be switched for the current thread or task only
+    (see :meth:`MixerGenerator.use`), so generators don't affect each other.
+    Every generator has its own providers, so `seed_instance` makes its
+    values reproducible.
+
+    """
 
     def __init__(self, locale=DEFAULT_LOCALE, providers=PROVIDERS, **config):
-        self._locale = None
-        self._envs = defaultdict(self.__create_env)
+        self._env = None
+        self._envs = dict()
+        self._providers = providers
+        self._context = _.ContextVar('mixer_locale_%d' % id(self), default=None)
+        self._scoped = 0
         self.locale = locale
         super(MixerGenerator, self).__init__(**config)
-        self.env.load(providers)
 
-    def __create_env(self):
-        return MixerProvider(self)
+    def __get_env(self, locale):
+        locale = normalize_locale(locale)
+        env = self._envs.get(locale)
+        if env is None:
+            env = self._envs.setdefault(
+                locale, LocaleGenerator(locale, self._providers, owner=self).env)
+        return env
 
     def __getattr__(self, name):
-        return getattr(self.env, name)
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        env = self._context.get() or self._env
+        method = env.methods.get(name)
+        if method is not None:
+            return method
+
+        if not env.loaded:
+            if name not in get_provider_names(self._providers) and \
+                    name not in get_provider_names(self._providers, env.locale):
+                raise AttributeError(name)
+            return LazyMethod(self, name)
+
+        return getattr(env, name)
+
+    random = property(_get_random)
 
     @property
     def providers(self):
@@ -123,35 +374,91 @@ class MixerGenerator(Generator):
 
     @providers.setter
     def providers(self, value):
-        self.env.providers = value
+        (self._context.get() or self._env).providers = value
 
     @property
     def locale(self):
-        return self._locale
+        return (self._context.get() or self._env).locale
 
     @locale.setter
     def locale(self, value):
-        value = pylocale.normalize(value.replace('-', '_')).split('.')[0]
-        if value not in AVAILABLE_LOCALES:
-            value = DEFAULT_LOCALE
+        self._env = self.__get_env(value)
 
-        if value == self._locale:
-            return None
+    @property
+    def env(self):
+        env = self._context.get() or self._env
+        if not env.loaded:
+            env.load(self._providers)
+        return env
 
-        nenv = self._envs[value]
-        senv = self.env
-        self._locale = value
+    @contextmanager
+    def use(self, locale=None):
+        """ Switch the locale for the current thread or task.
 
-        if senv.providers and not nenv.providers:
-            nenv.load([p.__provider__ for p in senv.providers], value)
+        ::
 
-    @property
-    def env(self):
-        return self._envs[self._locale]
+            with faker.use('ru'):
+                faker.name()
+
+        """
+        if not locale:
+            yield self
+            return
+
+        token = self._context.set(self.__get_env(locale))
+        with LOCK:
+            self._scoped += 1
+
+        try:
+            yield self
+        finally:
+            self._context.reset(token)
+            with LOCK:
+                self._scoped -= 1
+
+    def get_env(self):
+        """ Get the environment of the current locale (it could be not loaded yet).
+
+        The context is checked only while the locale is switched somewhere.
+
+        :return MixerProvider:
+
+        """
+        if self._scoped:
+            return self._context.get() or self._env
+        return self._env
+
+    def warm(self, *locales):
+        """ Load providers of the locales beforehand.
+
+        :return MixerGenerator:
+
+        """
+        for locale in locales or (self.locale,):
+            self.__get_env(locale).load(self._providers)
+        return self
+
+    def localize(self, func):
+        """ Get the method of the current locale for a provider's method.
+
+        :return function:
+
+        """
+        if isinstance(func, LazyMethod):
+            name = func.name
+        elif isinstance(getattr(func, '__self__', None), BaseProvider):
+            name = func.__name__
+        else:
+            return func
+
+        env = self.get_env()
+        if not env.loaded:
+            env.load(self._providers)
+
+        return env.methods.get(name, func)
 
     def set_formatter(self, name, method):
-        if not hasattr(self.env, name):
-            setattr(self.env, name, method)
+        self.env.set_formatter(name, method)
 
 
 faker = MixerGenerator()
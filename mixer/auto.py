@@ -1,9 +1,129 @@
-""" Automatic backend selection. """
+""" Automatic backend selection.
+
+Backends are detected by cheap checks: a scheme can't belong to a framework
+which hasn't been imported yet, so nothing heavy is imported for detection.
+Third-party backends are registered with :func:`register` or with the
+`mixer.backends` entry points (loaded only when the bundled backends don't match).
+
+"""
+import sys
 
 from .main import ProxyMixer
 from . import _compat as _
 
 
+ENTRY_POINTS = 'mixer.backends'
+
+
+class Backend(object):
+
+    """ A mixer backend for automatic selection.
+
+    :param name: Name of the backend
+    :param mixer: A path to the backend's mixer ('package.module.mixer')
+    :param detect: A function which returns True for the backend's schemes
+
+    """
+
+    def __init__(self, name, mixer, detect):
+        self.name = name
+        self.path = mixer
+        self.detect = detect
+        self.__mixer = None
+
+    def __repr__(self):
+        return '<Backend %s>' % self.name
+
+    @property
+    def mixer(self):
+        """ Import the backend's mixer on the first use. """
+        if self.__mixer is None:
+            mod, name = self.path.rsplit('.', 1)
+            self.__mixer = getattr(_.import_module(mod), name)
+        return self.__mixer
+
+
+def _get_class(module, path):
+    """ Get a class from the module if the module has been imported. """
+    mod = sys.modules.get(module)
+    for name in path.split('.'):
+        mod = getattr(mod, name, None)
+    return mod
+
+
+def _subclass(module, path):
+
+    def detect(scheme):
+        base = _get_class(module, path)
+        return base is not None and isinstance(scheme, type) and issubclass(scheme, base)
+
+    return detect
+
+
+def _is_sqlalchemy_model(scheme):
+    return 'sqlalchemy' in sys.modules and bool(getattr(scheme, '__mapper__', False))
+
+
+def _is_pony_entity(scheme):
+    meta = _get_class('pony.orm.core', 'EntityMeta')
+    return meta is not None and isinstance(scheme, meta)
+
+
+BACKENDS = [
+    Backend('django', 'mixer.backend.django.mixer', _subclass('django.db.models', 'Model')),
+    Backend('sqlalchemy', 'mixer.backend.sqlalchemy.mixer', _is_sqlalchemy_model),
+    Backend('mongoengine', 'mixer.backend.mongoengine.mixer',
+            _subclass('mongoengine.base.document', 'BaseDocument')),
+    Backend('peewee', 'mixer.backend.peewee.mixer', _subclass('peewee', 'Model')),
+    Backend('pony', 'mixer.backend.pony.mixer', _is_pony_entity),
+    Backend('marshmallow', 'mixer.backend.marshmallow.mixer',
+            _subclass('marshmallow', 'Schema')),
+]
+
+
+def register(backend):
+    """ Register a backend for automatic selection.
+
+    ::
+
+        from mixer.auto import Backend, register
+
+        register(Backend('mybackend', 'mybackend.mixer', lambda scheme: ...))
+
+    :param backend: A :class:`Backend` instance
+
+    """
+    BACKENDS.append(backend)
+    MixerProxy.__store__.clear()
+
+
+def load_entry_points():
+    """ Register the backends from the `mixer.backends` entry points.
+
+    An entry point should refer to a :class:`Backend` instance.
+
+    :return list: Registered backends
+
+    """
+    try:
+        from importlib.metadata import entry_points
+        points = entry_points()
+        points = points.select(group=ENTRY_POINTS) if hasattr(points, 'select') else \
+            points.get(ENTRY_POINTS, [])
+    except ImportError:
+        try:
+            from pkg_resources import iter_entry_points
+        except ImportError:
+            return []
+        points = iter_entry_points(ENTRY_POINTS)
+
+    backends = [point.load() for point in points]
+    for backend in backends:
+        register(backend)
+
+    return backends
+
+
 class MixerProxy(object):
 
     """ Load mixer for class automaticly.
@@ -19,6 +139,7 @@ class MixerProxy(object):
     """
 
     __store__ = dict()
+    __entry_points__ = False
 
     @classmethod
     def cycle(cls, count=5):
@@ -36,23 +157,36 @@ class MixerProxy(object):
         :return instance:
 
         """
-        scheme = cls.__load_cls(model)
-        backend = cls.__store__.get(scheme)
+        scheme, backend = cls.__get_backend(model)
+        return backend.blend(scheme, **params)
 
-        if not backend:
+    @classmethod
+    def _cycle(cls, model, count, **params):
+        scheme, backend = cls.__get_backend(model)
+        return backend._cycle(scheme, count, **params) # noqa
 
-            if cls.__is_django_model(scheme):
-                from .backend.django import mixer as backend
+    @classmethod
+    def __get_backend(cls, model):
+        scheme = cls.__load_cls(model)
+        if scheme not in cls.__store__:
+            backend = cls.__detect(scheme)
+            if backend is None and not cls.__entry_points__:
+                cls.__entry_points__ = True
+                load_entry_points()
+                backend = cls.__detect(scheme)
 
-            elif cls.__is_sqlalchemy_model(scheme):
-                from .backend.sqlalchemy import mixer as backend
+            if backend is None:
+                raise ValueError('Cannot find a backend for %s' % scheme)
 
-            elif cls.__is_mongoengine_model(scheme):
-                from .backend.mongoengine import mixer as backend
+            cls.__store__[scheme] = backend.mixer
 
-            cls.__store__[scheme] = backend
+        return scheme, cls.__store__[scheme]
 
-        return backend.blend(scheme, **params)
+    @staticmethod
+    def __detect(scheme):
+        for backend in BACKENDS:
+            if backend.detect(scheme):
+                return backend
 
     @staticmethod
     def __load_cls(cls_type):
@@ -62,25 +196,5 @@ class MixerProxy(object):
             cls_type = getattr(mod, cls_type)
         return cls_type
 
-    @staticmethod
-    def __is_django_model(model):
-        try:
-            from django.db.models import Model
-            return issubclass(model, Model)
-        except ImportError:
-            return False
-
-    @staticmethod
-    def __is_sqlalchemy_model(model):
-        return bool(getattr(model, '__mapper__', False))
-
-    @staticmethod
-    def __is_mongoengine_model(model):
-        try:
-            from mongoengine.base.document import BaseDocument
-            return issubclass(model, BaseDocument)
-        except ImportError:
-            return False
-
 
 mixer = MixerProxy()
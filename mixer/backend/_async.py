@@ -0,0 +1,82 @@
+""" Asyncio support for the backends.
+
+The module requires Python 3.5+ and is imported only from the backends'
+asynchronous methods.
+
+"""
+import asyncio
+from functools import partial
+
+try:
+    from asgiref.sync import sync_to_async
+except ImportError:
+    sync_to_async = None
+
+
+async def run_sync(func, *args, **kwargs):
+    """ Run a blocking function in a worker thread.
+
+    Django's `sync_to_async` is used when it's available, so the function runs
+    in the same thread (and with the same DB connection) as Django's own async
+    ORM methods.
+
+    """
+    if sync_to_async is not None:
+        return await sync_to_async(func, thread_sensitive=True)(*args, **kwargs)
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def blend(mixer, scheme, count=None, guards=None, **values):
+    """ Generate an object, a list of objects or find them with guards. """
+    if guards:
+        return mixer._guard(scheme, guards, **values)
+
+    if count is None:
+        return mixer.blend(scheme, **values)
+
+    return [mixer.blend(scheme, **values) for _ in range(count)]
+
+
+async def ablend(mixer, scheme, count=None, guards=None, **values):
+    """ Generate objects in one worker thread hop.
+
+    The objects and all their relations are generated and saved by the sync
+    code, but the thread is switched once for the whole batch.
+
+    :return: An instance or a list of instances when `count` is given
+
+    """
+    return await run_sync(blend, mixer, scheme, count, guards, **values)
+
+
+async def run_session(session, func, *args, **kwargs):
+    """ Run a blocking function which uses the sync session of SQLAlchemy's AsyncSession. """
+    from .sqlalchemy import ASYNC
+
+    def run(sync_session):
+        token = ASYNC.set(True)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            ASYNC.reset(token)
+
+    return await session.run_sync(run)
+
+
+async def ablend_session(mixer, scheme, count=None, guards=None, **values):
+    """ Generate objects with SQLAlchemy's AsyncSession.
+
+    Generated objects are added to the session and committed once for
+    the whole batch.
+
+    :return: An instance or a list of instances when `count` is given
+
+    """
+    session = mixer.params.get('session')
+    result = await run_session(session, blend, mixer, scheme, count, guards, **values)
+    if mixer.params.get('commit'):
+        await session.commit()
+
+    return result
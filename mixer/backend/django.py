@@ -3,21 +3,31 @@ from __future__ import absolute_import
 
 import datetime as dt
 import decimal
+import inspect
+import json
+import struct
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from os import path
 from types import GeneratorType
 
 from django.apps import apps
 from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation   # noqa
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import ContentFile
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import validate_ipv4_address, validate_ipv6_address
-from django.db import models
+from django.db import DatabaseError, models
+from django.db.models.signals import m2m_changed, post_migrate, post_save, pre_save
+from django.utils.encoding import is_protected_type
 
 from .. import mix_types as t, _compat as _
 from ..main import (
     SKIP_VALUE, TypeMixerMeta as BaseTypeMixerMeta, TypeMixer as BaseTypeMixer,
-    GenFactory as BaseFactory, Mixer as BaseMixer, partial, faker)
+    GenFactory as BaseFactory, Mixer as BaseMixer, partial, faker, lazy_mixer)
 
 
 get_contentfile = ContentFile
@@ -40,25 +50,311 @@ class UTCZone(dt.tzinfo):
 
 UTC = UTCZone()
 
+HASHER_SETTINGS = 'iterations', 'rounds', 'time_cost', 'memory_cost', 'parallelism'
 
-def get_file(filepath=MOCK_FILE, **kwargs):
+PASSWORDS_CACHE = OrderedDict()
+
+PASSWORDS_CACHE_SIZE = 128
+
+FILES_CACHE = dict()
+
+CONTENT_TYPES = dict()
+
+# Types of values which are returned as is by the fields' `to_python`
+TRUSTED_TYPES = {
+    models.BooleanField.to_python: bool,
+    models.CharField.to_python: _.text_type,
+    models.DateField.to_python: dt.date,
+    models.DateTimeField.to_python: dt.datetime,
+    models.DecimalField.to_python: decimal.Decimal,
+    models.FloatField.to_python: float,
+    models.IntegerField.to_python: int,
+    models.TextField.to_python: _.text_type,
+    models.TimeField.to_python: dt.time,
+}
+
+SMALL_INTEGER_FIELDS = models.SmallIntegerField, models.PositiveSmallIntegerField
+
+MODEL_SIGNALS = pre_save, post_save, m2m_changed
+
+
+class _Muted(threading.local):
+
+    """ An instance which signals are muted in the current thread. """
+
+    instance = None
+    receivers = {}
+
+
+MUTED = _Muted()
+
+
+class _SignalsPatch(object):
+
+    """ Route model signals through mixer while any thread mutes them. """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = 0
+        self.backup = []
+
+    def __enter__(self):
+        with self.lock:
+            if not self.users:
+                for signal in MODEL_SIGNALS:
+                    methods = vars(signal)
+                    self.backup.append((
+                        signal, methods.get('send'), methods.get('send_robust')))
+                    signal.send = partial(_send_signal, signal, signal.send, False)
+                    signal.send_robust = partial(
+                        _send_signal, signal, signal.send_robust, True)
+            self.users += 1
+
+    def __exit__(self, *args):
+        with self.lock:
+            self.users -= 1
+            if self.users:
+                return
+
+            for signal, send, send_robust in self.backup:
+                for name, method in (('send', send), ('send_robust', send_robust)):
+                    if method is None:
+                        delattr(signal, name)
+                    else:
+                        setattr(signal, name, method)
+            self.backup = []
+
+
+SIGNALS_PATCH = _SignalsPatch()
+
+
+def _live_receivers(signal, sender):
+    """ Get the receivers connected to the signal for the sender. """
+    receivers = signal._live_receivers(sender)
+
+    # Django 5 splits sync and async receivers
+    if isinstance(receivers, tuple):
+        receivers = list(receivers[0]) + list(receivers[1])
+
+    return receivers
+
+
+def _send_signal(signal, send, robust, sender, **named):
+    """ Send a model signal only to the allowed receivers for a muted instance. """
+    if MUTED.instance is None or named.get('instance') is not MUTED.instance:
+        return send(sender, **named)
+
+    allowed = MUTED.receivers.get(signal)
+    if not allowed:
+        return []
+
+    responses = []
+    for receiver in _live_receivers(signal, sender):
+        if receiver not in allowed:
+            continue
+
+        if getattr(inspect, 'iscoroutinefunction', bool)(receiver):
+            from asgiref.sync import async_to_sync
+            receiver = async_to_sync(receiver)
+
+        try:
+            responses.append((receiver, receiver(signal=signal, sender=sender, **named)))
+        except Exception as err:
+            if not robust:
+                raise
+            responses.append((receiver, err))
+
+    return responses
+
+
+@contextmanager
+def mute_signals(instance, receivers=False):
+    """ Don't send model signals for the instance.
+
+    Signals are routed through mixer only inside of the block and only for
+    the given instance in the current thread.
+
+    :param instance: A model instance
+    :param receivers: True to keep the signals, False to mute them all or
+                      a dict which maps signals to the receivers which are
+                      still called (if they are connected for the sender)
+
+    """
+    if receivers is True or receivers is None:
+        yield instance
+        return
+
+    backup = MUTED.instance, MUTED.receivers
+    with SIGNALS_PATCH:
+        MUTED.instance, MUTED.receivers = instance, receivers or {}
+        try:
+            yield instance
+        finally:
+            MUTED.instance, MUTED.receivers = backup
+
+
+def get_file(filepath=MOCK_FILE, _scheme=None, _typemixer=None, **kwargs):
     """ Generate a content file.
 
+    The content of the file is read once and shared between generated files.
+
     :return ContentFile:
 
     """
-    with open(filepath, 'rb') as f:
-        name = path.basename(filepath)
-        return get_contentfile(f.read(), name)
+    if filepath not in FILES_CACHE:
+        with open(filepath, 'rb') as f:
+            FILES_CACHE[filepath] = f.read()
+
+    return make_file(FILES_CACHE[filepath], path.basename(filepath), _scheme, _typemixer)
 
 
-def get_image(filepath=MOCK_IMAGE):
+def get_image(filepath=MOCK_IMAGE, width=None, height=None, _scheme=None, _typemixer=None,
+              **kwargs):
     """ Generate a content image.
 
+    :param width: Generate a GIF image with the given size instead of the mock one
+    :param height: Generate a GIF image with the given size instead of the mock one
+
     :return ContentFile:
 
     """
-    return get_file(filepath)
+    if not (width or height):
+        return get_file(filepath, _scheme=_scheme, _typemixer=_typemixer)
+
+    key = (width or 1, height or 1)
+    if key not in FILES_CACHE:
+        FILES_CACHE[key] = get_gif(*key)
+
+    return make_file(FILES_CACHE[key], 'image.gif', _scheme, _typemixer)
+
+
+def make_file(content, name, _scheme=None, _typemixer=None):
+    """ Make a file value for a FileField.
+
+    When mixer is initialized with `storage=False` the file is kept in memory and
+    is not written to the field's storage.
+
+    :return ContentFile or FieldFile:
+
+    """
+    content = get_contentfile(content, name)
+    mixer = _typemixer and _typemixer._TypeMixer__mixer
+    if _scheme is None or not mixer or mixer.params.get('storage', True):
+        return content
+
+    value = _scheme.attr_class(None, _scheme, name)
+    value.file = content
+    return value
+
+
+def get_gif(width=1, height=1):
+    """ Generate a blank GIF image.
+
+    :return bytes:
+
+    """
+    # Use 3-bit LZW codes and clear the codes table after every two pixels,
+    # so 16 pixels are always packed to the same 9 bytes.
+    pixels = width * height
+    tail = pixels % 16
+    data = _pack_codes([4, 0, 0] * 8) * (pixels // 16) + _pack_codes(
+        [4, 0, 0] * (tail // 2) + [4, 0] * (tail % 2) + [5])
+
+    blocks = bytearray()
+    for start in range(0, len(data), 255):
+        chunk = data[start:start + 255]
+        blocks += struct.pack('B', len(chunk)) + chunk
+
+    return bytes(
+        b'GIF89a' + struct.pack('<HHBBB', width, height, 0x80, 0, 0) +
+        b'\xff\xff\xff\x00\x00\x00' +
+        b',' + struct.pack('<HHHHB', 0, 0, width, height, 0) +
+        b'\x02' + blocks + b'\x00;')
+
+
+def _pack_codes(codes):
+    """ Pack 3-bit LZW codes to bytes. """
+    data = bytearray()
+    bits = size = 0
+    for code in codes:
+        bits |= code << size
+        size += 3
+        while size >= 8:
+            data.append(bits & 0xff)
+            bits >>= 8
+            size -= 8
+
+    if size:
+        data.append(bits)
+
+    return data
+
+
+def get_password(raw_password, hasher='default'):
+    """ Hash a raw password once per hasher and its settings.
+
+    Only the last `PASSWORDS_CACHE_SIZE` passwords are kept, so unique random
+    passwords don't grow the cache.
+
+    :return str: An encoded password
+
+    """
+    hasher = get_hasher(hasher)
+    key = (type(hasher), raw_password) + tuple(
+        getattr(hasher, name, None) for name in HASHER_SETTINGS)
+
+    password = PASSWORDS_CACHE.pop(key, None)
+    if password is None:
+        password = make_password(raw_password, hasher=hasher)
+        if len(PASSWORDS_CACHE) >= PASSWORDS_CACHE_SIZE:
+            PASSWORDS_CACHE.popitem(last=False)
+
+    PASSWORDS_CACHE[key] = password
+    return password
+
+
+def is_encoded(password):
+    """ Check that the password is encoded by one of the hashers.
+
+    :return bool:
+
+    """
+    if not password:
+        return False
+
+    try:
+        identify_hasher(password)
+    except ValueError:
+        return False
+    return True
+
+
+def hash_password(raw='test'):
+    """ Make a middleware which sets a cached hash of the password to users.
+
+    Users get the same raw password, so it's hashed once. Passwords which
+    are already encoded are kept.
+
+    ::
+
+        from mixer.backend.django import mixer, hash_password
+
+        mixer.middleware('auth.user')(hash_password())
+        user = mixer.blend('auth.user')
+        user.check_password('test')  # True
+
+    :param raw: ('test') A raw password of users (None to hash the users' own
+                passwords)
+
+    :return function:
+
+    """
+    def middleware(user):
+        if not is_encoded(user.password):
+            user.password = get_password(user.password if raw is None else raw)
+        return user
+
+    return middleware
 
 
 def get_relation(_scheme=None, _typemixer=None, **params):
@@ -66,14 +362,39 @@ def get_relation(_scheme=None, _typemixer=None, **params):
     scheme = _scheme.related_model
 
     if scheme is ContentType:
-        choices = [m for m in apps.get_models() if m is not ContentType]
-        return ContentType.objects.get_for_model(faker.random_element(choices))
+        return get_content_type()
 
     return TypeMixer(scheme, mixer=_typemixer._TypeMixer__mixer,
                      factory=_typemixer._TypeMixer__factory,
                      fake=_typemixer._TypeMixer__fake,).blend(**params)
 
 
+def get_content_type(**params):
+    """ Get a ContentType for a random model.
+
+    Models are collected once per apps registry state and their content types
+    are loaded to the ContentType cache with a single query.
+
+    :return ContentType:
+
+    """
+    registry = apps.get_models()
+    if CONTENT_TYPES.get('models') is not registry:
+        choices = [m for m in registry if m is not ContentType]
+        ContentType.objects.get_for_models(*choices)
+        CONTENT_TYPES.update(models=registry, choices=choices)
+
+    return ContentType.objects.get_for_model(faker.random_element(CONTENT_TYPES['choices']))
+
+
+def reset_content_types(**kwargs):
+    """ Drop the cached content types when they could be recreated. """
+    CONTENT_TYPES.clear()
+
+
+post_migrate.connect(reset_content_types, dispatch_uid='mixer.content_types')
+
+
 def get_datetime(**params):
     """ Support Django TZ support. """
     return faker.date_time(tzinfo=UTC if settings.USE_TZ else None)
@@ -127,34 +448,51 @@ class TypeMixerMeta(BaseTypeMixerMeta):
 
         """
         params['models_cache'] = dict()
+        params['models_index'] = dict()
+        params['models_registry'] = None
         cls = super(TypeMixerMeta, mcs).__new__(mcs, name, bases, params)
         return cls
 
     def __load_cls(cls, cls_type):
 
         if isinstance(cls_type, _.string_types):
-            if '.' in cls_type:
-                app_label, model_name = cls_type.split(".")
-                return apps.get_model(app_label, model_name)
 
-            else:
-                try:
+            registry = apps.get_models()
+            if cls.models_registry is not registry:
+                cls.__update_cache(registry)
 
-                    if cls_type not in cls.models_cache:
-                        cls.__update_cache()
+            if cls_type not in cls.models_cache:
+                cls.models_cache[cls_type] = cls.__find_model(cls_type)
 
-                    return cls.models_cache[cls_type]
-
-                except KeyError:
-                    raise ValueError('Model "%s" not found.' % cls_type)
+            return cls.models_cache[cls_type]
 
         return cls_type
 
-    def __update_cache(cls):
-        """ Update apps cache for Django < 1.7. """
+    def __find_model(cls, name):
+        """ Find a model by "app_label.ModelName" or by a model name. """
+        if '.' in name:
+            app_label, model_name = name.split(".")
+            return apps.get_model(app_label, model_name)
+
+        models_ = cls.models_index.get(name.lower())
+        if not models_:
+            raise ValueError('Model "%s" not found.' % name)
+
+        if len(models_) > 1:
+            raise ValueError('Model "%s" is ambiguous: %s' % (
+                name, ', '.join(m._meta.label for m in models_)))
+
+        return models_[0]
+
+    def __update_cache(cls, registry):
+        """ Index models by names. Rebuild the index when apps registry is changed. """
+        cls.models_cache = dict()
+        cls.models_index = dict()
         for app in apps.all_models:
             for name, model in apps.all_models[app].items():
-                cls.models_cache[name] = model
+                cls.models_index.setdefault(name, []).append(model)
+
+        cls.models_registry = registry
 
 
 class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
@@ -198,7 +536,12 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
             if not isinstance(value, (list, tuple)):
                 value = [value]
 
-            getattr(target, name).set(value)
+            if self.__mixer and self.__mixer.params.get('export'):
+                self.__mixer.params['export'].dump_m2m(deffered.scheme, target, value)
+                continue
+
+            with mute_signals(target, self.__mixer and self.__mixer.params.get('signals')):
+                getattr(target, name).set(value)
 
         return target
 
@@ -229,7 +572,8 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
             if callable(value):
                 return self._get_value(name, value(), field)
 
-            if field and not isinstance(field.scheme, models.ForeignKey):
+            if field and not isinstance(field.scheme, models.ForeignKey) and \
+                    type(value) is not TRUSTED_TYPES.get(type(field.scheme).to_python):
                 value = field.scheme.to_python(value)
 
         return name, value
@@ -320,7 +664,7 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
             # default address is either IPv4 or IPv6
             kwargs['protocol'] = protocol.lower()
 
-        elif isinstance(field, models.fields.related.RelatedField):
+        elif isinstance(field, (models.fields.related.RelatedField, models.FileField)):
             kwargs.update({'_typemixer': self, '_scheme': field})
 
         return super(TypeMixer, self).make_fabric(
@@ -359,6 +703,32 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta, BaseTypeMixer)):
 
         return True
 
+    def reserve(self, field):
+        """ Load values of the unique field from database.
+
+        :return tuple: (stored values, max stored value for integer fields)
+
+        """
+        scheme = field.scheme
+        if scheme.is_relation:
+            return set(), None
+
+        # Small integers and choices can't grow over the stored maximum
+        qs = self.__scheme._default_manager.all()
+        if isinstance(scheme, (models.AutoField, models.IntegerField)) and not (
+                scheme.choices or isinstance(scheme, SMALL_INTEGER_FIELDS)):
+            return set(), qs.aggregate(top=models.Max(scheme.attname))['top']
+
+        return set(qs.values_list(scheme.attname, flat=True)), None
+
+    def get_stored(self):
+        """ Get an instance from database.
+
+        :return: An instance or None
+
+        """
+        return self.__scheme._default_manager.first()
+
     def guard(self, *args, **kwargs):
         """ Look objects in database.
 
@@ -406,14 +776,86 @@ class Mixer(BaseMixer):
 
     type_mixer_cls = TypeMixer
 
-    def __init__(self, commit=True, **params):
+    def __init__(self, commit=True, signals=True, storage=True, **params):
         """Initialize Mixer instance.
 
         :param commit: (True) Save object to database.
+        :param signals: (True) Send model signals for generated objects.
+                        Set False to mute them or pass a dict which maps
+                        signals to receivers which should be called instead
+                        of the connected ones (`{post_save: [receiver]}`).
+        :param storage: (True) Save generated files to the fields' storages.
+                        Set False to keep them in memory only.
 
         """
         super(Mixer, self).__init__(**params)
         self.params['commit'] = commit
+        self.params['signals'] = signals
+        self.params['storage'] = storage
+        self.params['export'] = None
+
+    def ablend(self, scheme, **values):
+        """ Generate instance of `scheme` from asyncio code.
+
+        The instance and its relations are generated in a worker thread, so the
+        sync ORM calls don't block the event loop. Use `mixer.cycle(count).ablend`
+        to generate a batch with one thread switch.
+
+        ::
+
+            rabbit = await mixer.ablend(Rabbit)
+            rabbits = await mixer.cycle(100).ablend(Rabbit)
+
+        :return: An awaitable instance
+
+        """
+        return self._ablend(scheme, None, None, **values)
+
+    def _ablend(self, scheme, count, guards, **values):
+        from ._async import ablend
+        return ablend(self, scheme, count, guards, **values)
+
+    def export(self, scheme, count, path, format='json', pk_start=None, **values):
+        """ Generate objects and write them to a fixture instead of database.
+
+        Objects are serialized one by one, so memory doesn't depend on `count`.
+        Related objects are written before the objects which refer to them,
+        primary keys are assigned by mixer and many-to-many relations are
+        written as rows of the through models.
+
+        By default primary keys of each table continue from the biggest one
+        stored in the current database (or start from 1 when the database is
+        not available). `loaddata` overwrites rows with the same primary keys,
+        so the fixture has to be generated against the database it is loaded
+        to or with a `pk_start` which is free there.
+
+        ::
+
+            mixer.export(Rabbit, 100000, 'rabbits.jsonl', format='jsonl')
+            mixer.export(Rabbit, 100, 'rabbits.json', pk_start=10 ** 6)
+
+        :param scheme: Model for generation
+        :param count: Number of objects
+        :param path: A file path or a stream for writing
+        :param format: 'json' (for `loaddata`) or 'jsonl' (a row per line)
+        :param pk_start: (None) The first primary key for each table
+        :param values: Predefined fields
+
+        :return int: Number of written rows
+
+        """
+        stream = path if hasattr(path, 'write') else open(path, 'w')
+        try:
+            exporter = Exporter(stream, format, pk_start)
+            with self.ctx(commit=False, export=exporter):
+                for _ in range(count):
+                    self.blend(scheme, **values)
+            exporter.close()
+        finally:
+            if stream is not path:
+                stream.close()
+
+        return exporter.count
 
     def postprocess(self, target):
         """ Save objects in db.
@@ -421,13 +863,108 @@ class Mixer(BaseMixer):
         :return value: A generated value
 
         """
-        if self.params.get('commit'):
-            target.save()
+        if self.params.get('export'):
+            self.params['export'].dump(target)
+
+        elif self.params.get('commit'):
+            with mute_signals(target, self.params.get('signals')):
+                target.save()
 
         return target
 
 
+class Exporter(object):
+
+    """ Serialize generated objects to a fixture stream. """
+
+    formats = 'json', 'jsonl'
+
+    def __init__(self, stream, format='json', pk_start=None):
+        if format not in self.formats:
+            raise ValueError('Unsupported format: %s' % format)
+
+        self.stream = stream
+        self.format = format
+        self.count = 0
+        self.pk_start = pk_start
+        self.pks = dict()
+
+        if format == 'json':
+            self.stream.write('[')
+
+    def dump(self, obj):
+        """ Assign a primary key to the object and write it. """
+        opts = obj._meta
+        parents = opts.get_parent_list()
+        root = parents[-1] if parents else type(obj)
+
+        pk = obj.pk
+        if pk is None and isinstance(root._meta.pk, models.AutoField):
+            pk = self.next_pk(root)
+            for model in [type(obj)] + list(parents):
+                setattr(obj, model._meta.pk.attname, pk)
+
+        for model in list(reversed(parents)) + [opts.concrete_model]:
+            self.write(model, pk, dict(
+                (field.name, self.get_value(obj, field))
+                for field in model._meta.local_fields if field.serialize
+            ))
+
+    def dump_m2m(self, field, target, values):
+        """ Write rows of an auto created through model. """
+        through = field.remote_field.through
+        source, dest = field.m2m_field_name(), field.m2m_reverse_field_name()
+        symmetrical = field.remote_field.symmetrical and field.related_model is type(target)
+        for value in values:
+            self.write(through, self.next_pk(through), {source: target.pk, dest: value.pk})
+            if symmetrical and value is not target:
+                self.write(through, self.next_pk(through), {source: value.pk, dest: target.pk})
+
+    def next_pk(self, model):
+        """ Get a next primary key for the model's table. """
+        if model not in self.pks:
+            self.pks[model] = self.get_pk_start(model) - 1
+
+        self.pks[model] += 1
+        return self.pks[model]
+
+    def get_pk_start(self, model):
+        """ Get the first primary key for the model's table. """
+        if self.pk_start is not None:
+            return self.pk_start
+
+        try:
+            top = model._base_manager.aggregate(top=models.Max('pk'))['top']
+        except DatabaseError:
+            top = None
+
+        return (top or 0) + 1
+
+    def write(self, model, pk, fields):
+        """ Write a fixture row. """
+        row = json.dumps(
+            dict(model=model._meta.label_lower, pk=pk, fields=fields), cls=DjangoJSONEncoder)
+
+        if self.format == 'jsonl':
+            self.stream.write(row + '\n')
+
+        else:
+            self.stream.write((self.count and ',\n' or '\n') + row)
+
+        self.count += 1
+
+    def close(self):
+        """ Finish the fixture. """
+        if self.format == 'json':
+            self.stream.write('\n]\n')
+
+    @staticmethod
+    def get_value(obj, field):
+        value = field.value_from_object(obj)
+        return value if is_protected_type(value) else field.value_to_string(obj)
+
+
 # Default mixer
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 # pylama:ignore=E1120
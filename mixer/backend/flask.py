@@ -11,6 +11,7 @@ See example: ::
 """
 from __future__ import absolute_import
 
+from ..main import lazy_mixer, partial
 from .sqlalchemy import TypeMixer, Mixer as BaseMixer
 
 
@@ -52,6 +53,6 @@ class Mixer(BaseMixer):
 
 
 # Default mixer
-mixer = Mixer(commit=True)
+__getattr__ = lazy_mixer(globals(), partial(Mixer, commit=True))
 
 # lint_ignore=W0201
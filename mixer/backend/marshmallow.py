@@ -10,28 +10,57 @@ from __future__ import absolute_import
 
 import datetime as dt
 import decimal
+import json
+import uuid
+from contextlib import contextmanager
 
 from marshmallow import fields, validate, missing
 
-from .. import mix_types as t
+from .. import mix_types as t, _compat as _
 from ..main import (
     TypeMixer as BaseTypeMixer, Mixer as BaseMixer, GenFactory as BaseFactory,
-    LOGGER, faker, partial, SKIP_VALUE)
+    LOGGER, faker, partial, SKIP_VALUE, lazy_mixer)
 
 
 def get_nested(_scheme=None, _typemixer=None, _many=False, **kwargs):
     """Create nested objects."""
-    obj = TypeMixer(
+    type_mixer = TypeMixer(
         _scheme,
         mixer=_typemixer._TypeMixer__mixer,
         factory=_typemixer._TypeMixer__factory,
         fake=_typemixer._TypeMixer__fake,
-    ).blend(**kwargs)
+    )
+
+    # Nested data is loaded with the parent one
+    with type_mixer.raw(_typemixer._TypeMixer__raw.get()):
+        obj = type_mixer.blend(**kwargs)
+
     if _many:
         return [obj]
     return obj
 
 
+def to_payload(value):
+    """ Convert generated values to JSON types.
+
+    :return value:
+
+    """
+    if isinstance(value, dict):
+        return dict((name, to_payload(v)) for name, v in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return [to_payload(v) for v in value]
+
+    if isinstance(value, (dt.date, dt.time)):
+        return value.isoformat()
+
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+
+    return value
+
+
 class GenFactory(BaseFactory):
 
     """Support for Marshmallow fields."""
@@ -68,6 +97,14 @@ class TypeMixer(BaseTypeMixer):
 
     factory = GenFactory
 
+    def __init__(self, cls, **params):
+        """ Init TypeMixer and create the schema once. """
+        super(TypeMixer, self).__init__(cls, **params)
+        self.schema = self.__scheme()
+
+        # The typemixer is shared, so the raw mode is set for the current thread or task
+        self.__raw = _.ContextVar('mixer_marshmallow_raw_%d' % id(self), default=False)
+
     def __load_fields(self):
         for name, field in self.__scheme._declared_fields.items():
             yield name, t.Field(field, name)
@@ -92,7 +129,25 @@ class TypeMixer(BaseTypeMixer):
 
     def populate_target(self, values):
         """ Populate target. """
-        data, errors = self.__scheme().load(dict(values))
+        values = dict(values)
+        return values if self.__raw.get() else self.load(values)
+
+    @contextmanager
+    def raw(self, raw=True):
+        """ Don't load the generated values (to load them in a batch). """
+        token = self.__raw.set(raw)
+        try:
+            yield self
+        finally:
+            self.__raw.reset(token)
+
+    def load(self, data, many=False):
+        """ Load data with the cached schema.
+
+        :return: Loaded data (a list if `many` is True)
+
+        """
+        data, errors = self.schema.load(data, many=many)
         if errors:
             LOGGER.error("Mixer-marshmallow: %r", errors)
         return data
@@ -112,6 +167,18 @@ class TypeMixer(BaseTypeMixer):
             if isinstance(validator, validate.OneOf):
                 return partial(faker.random_element, validator.choices)
 
+            if isinstance(validator, validate.Range) and isinstance(field, fields.Integer):
+                low, high = validator.min, validator.max
+                if low is None:
+                    low = 0 if high is None or high >= 0 else high - 9999
+                if high is None:
+                    high = low + 9999
+                return partial(faker.random_int, low, high)
+
+            if isinstance(validator, validate.Length) and isinstance(field, fields.String):
+                return partial(
+                    faker.pystr, min_chars=validator.min, max_chars=validator.max or 20)
+
         return super(TypeMixer, self).make_fabric(
             type(field), field_name=field_name, fake=fake, kwargs=kwargs)
 
@@ -128,5 +195,48 @@ class Mixer(BaseMixer):
         # All fields is required by default
         self.params.setdefault('required', True)
 
+    def payload(self, scheme, count=None, **values):
+        """ Generate request bodies for the schema.
+
+        The data is converted to JSON types but isn't loaded by the schema,
+        so validation and `post_load` hooks are skipped.
+
+        ::
+
+            bodies = mixer.payload(UserSchema, 1000)
+
+        :param count: Number of payloads (return a single one if None)
+
+        :return: A dict (or a list of dicts)
+
+        """
+        type_mixer = self.get_typemixer(scheme)
+        with type_mixer.raw():
+            if count is None:
+                return to_payload(self.blend(scheme, **values))
+
+            return [to_payload(self.blend(scheme, **values)) for _ in range(count)]
+
+    def stream(self, scheme, count, **values):
+        """ Generate request bodies lazily as JSON encoded bytes.
+
+        ::
+
+            for body in mixer.stream(UserSchema, 10 ** 6):
+                client.post('/users', data=body)
+
+        :return: A generator of bytes
+
+        """
+        for _ in range(count):
+            yield json.dumps(self.payload(scheme, **values)).encode('utf-8')
+
+    def _cycle(self, scheme, count, **values):
+        type_mixer = self.get_typemixer(scheme)
+        with type_mixer.raw():
+            data = super(Mixer, self)._cycle(scheme, count, **values)
+
+        return type_mixer.load(data, many=True)
+
 
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
@@ -47,14 +47,20 @@ from mongoengine import (
     URLField,
     UUIDField,
 )
+from mongoengine.base.common import _document_registry
 
 from .. import mix_types as t
+from ..geo import geo
 from ..main import (
     SKIP_VALUE, TypeMixer as BaseTypeMixer, GenFactory as BaseFactory,
-    Mixer as BaseMixer, partial, faker
+    Mixer as BaseMixer, partial, faker, lazy_mixer
 )
 
 
+# Documents for generic references by source schemes
+GENERIC_REFERENCES = dict()
+
+
 def get_objectid(**kwargs):
     """ Create a new ObjectId instance.
 
@@ -64,13 +70,22 @@ def get_objectid(**kwargs):
     return ObjectId()
 
 
+def get_geopoint(**kwargs):
+    """ Get a legacy coordinate pair.
+
+    :return list:
+
+    """
+    return geo.coordinates(1)[0]
+
+
 def get_pointfield(**kwargs):
     """ Get a Point structure.
 
     :return dict:
 
     """
-    return dict(type='Point', coordinates=faker.coordinates())
+    return geo.point()
 
 
 def get_linestring(length=5, **kwargs):
@@ -79,36 +94,41 @@ def get_linestring(length=5, **kwargs):
     :return dict:
 
     """
-    return dict(type='LineString', coordinates=[faker.coordinates() for _ in range(length)])
+    return geo.linestring(length)
 
 
 def get_polygon(length=5, **kwargs):
-    """ Get a Poligon structure.
+    """ Get a Polygon structure.
 
     :return dict:
 
     """
-    lines = []
-    for _ in range(length):
-        line = get_linestring()['coordinates']
-        if lines:
-            line.insert(0, lines[-1][-1])
+    return geo.polygon(length)
+
+
+def get_documents(scheme):
+    """ Get registered documents which a generic reference can point to.
 
-        lines.append(line)
+    The list is cached per scheme and rebuilt when new documents are registered.
 
-    if lines:
-        lines[0].insert(0, lines[-1][-1])
+    :return list:
+
+    """
+    size = len(_document_registry)
+    if GENERIC_REFERENCES.get(scheme, (None,))[0] != size:
+        GENERIC_REFERENCES[scheme] = size, [
+            document for document in (
+                _document_registry[name] for name in sorted(_document_registry))
+            if issubclass(document, Document) and document is not scheme and
+            not document._meta.get('abstract')
+        ]
 
-    return dict(type='Poligon', coordinates=lines)
+    return GENERIC_REFERENCES[scheme][1]
 
 
 def get_generic_reference(_typemixer=None, **params):
     """ Choose a GenericRelation. """
-    meta = type(_typemixer)
-    scheme = faker.random_element([
-        m for (_, m, _, _) in meta.mixers.keys()
-        if issubclass(m, Document) and m is not _typemixer._TypeMixer__scheme # noqa
-    ])
+    scheme = faker.random.choice(get_documents(_typemixer._TypeMixer__scheme)) # noqa
 
     return TypeMixer(scheme, mixer=_typemixer._TypeMixer__mixer,
                      factory=_typemixer._TypeMixer__factory,
@@ -133,7 +153,7 @@ class GenFactory(BaseFactory):
 
     generators = {
         GenericReferenceField: get_generic_reference,
-        GeoPointField: faker.coordinates,
+        GeoPointField: get_geopoint,
         LineStringField: get_linestring,
         ObjectIdField: get_objectid,
         PointField: get_pointfield,
@@ -295,7 +315,7 @@ class Mixer(BaseMixer):
         return target
 
 
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 
 # pylama:ignore=E1120
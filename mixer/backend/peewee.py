@@ -19,7 +19,7 @@ import decimal
 from .. import mix_types as t
 from ..main import (
     TypeMixer as BaseTypeMixer, Mixer as BaseMixer, SKIP_VALUE,
-    GenFactory as BaseFactory, partial, faker)
+    GenFactory as BaseFactory, partial, faker, lazy_mixer)
 
 
 def get_relation(_scheme=None, _typemixer=None, **params):
@@ -151,6 +151,30 @@ class TypeMixer(BaseTypeMixer):
         return super(TypeMixer, self).make_fabric(
             type(field), field_name=field_name, fake=fake, kwargs=kwargs)
 
+    def reserve(self, field):
+        """ Load values of the unique field from database.
+
+        :return tuple: (stored values, max stored value for integer fields)
+
+        """
+        scheme = field.scheme
+        if isinstance(scheme, ForeignKeyField):
+            return set(), None
+
+        if isinstance(scheme, IntegerField) and not (
+                scheme.choices or isinstance(scheme, SmallIntegerField)):
+            return set(), self.__scheme.select(fn.MAX(scheme)).scalar()
+
+        return set(value for (value,) in self.__scheme.select(scheme).tuples()), None
+
+    def get_stored(self):
+        """ Get an instance from database.
+
+        :return: An instance or None
+
+        """
+        return self.__scheme.select().first()
+
     def guard(self, *args, **kwargs):
         """ Look objects in database.
 
@@ -199,6 +223,6 @@ class Mixer(BaseMixer):
 
 
 # Default Peewee mixer
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 # pylama:ignore=E1120
@@ -9,7 +9,7 @@ from __future__ import absolute_import
 from pony.orm import commit
 
 from .. import mix_types as t
-from ..main import TypeMixer as BaseTypeMixer, Mixer as BaseMixer, SKIP_VALUE
+from ..main import TypeMixer as BaseTypeMixer, Mixer as BaseMixer, SKIP_VALUE, lazy_mixer
 
 
 class TypeMixer(BaseTypeMixer):
@@ -83,6 +83,6 @@ class Mixer(BaseMixer):
 
 
 # Default Pony mixer
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 # pylama:ignore=E1120
@@ -5,10 +5,9 @@ import datetime
 from types import GeneratorType
 
 import decimal
-from sqlalchemy import func
+from sqlalchemy import func, inspect
 # from sqlalchemy.orm.interfaces import MANYTOONE
-from sqlalchemy.orm.collections import InstrumentedList
-from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.orm.attributes import InstrumentedAttribute, instance_dict
 from sqlalchemy.sql.type_api import TypeDecorator
 try:
     from sqlalchemy.orm.relationships import RelationshipProperty
@@ -20,10 +19,15 @@ from sqlalchemy.types import (
     Numeric, SMALLINT, SmallInteger, String, TEXT, TIME, Text, Time, Unicode,
     UnicodeText, VARCHAR, Enum)
 
-from .. import mix_types as t
+from .. import mix_types as t, _compat as _
 from ..main import (
     SKIP_VALUE, LOGGER, TypeMixer as BaseTypeMixer, GenFactory as BaseFactory,
-    Mixer as BaseMixer, partial, faker)
+    Mixer as BaseMixer, partial, faker, lazy_mixer)
+
+
+# Mark that the code runs inside of `AsyncSession.run_sync`. Concurrent tasks
+# run in the same thread, so the mark is kept in a context variable.
+ASYNC = _.ContextVar('mixer_sqlalchemy_async', default=False)
 
 
 class GenFactory(BaseFactory):
@@ -56,9 +60,12 @@ class TypeMixer(BaseTypeMixer):
     factory = GenFactory
 
     def __init__(self, cls, **params):
-        """ Init TypeMixer and save the mapper. """
+        """ Init TypeMixer and save the mapper and the list relations. """
         super(TypeMixer, self).__init__(cls, **params)
         self.mapper = self.__scheme._sa_class_manager.mapper
+        self.collections = frozenset(
+            rel.key for rel in self.mapper.relationships
+            if rel.uselist and (rel.collection_class or list) is list)
 
     def postprocess(self, target, postprocess_values):
         """ Fill postprocess values. """
@@ -71,7 +78,7 @@ class TypeMixer(BaseTypeMixer):
             if isinstance(value, t.Mix):
                 mixed.append((name, value))
                 continue
-            if isinstance(getattr(target, name), InstrumentedList) and not isinstance(value, list):
+            if name in self.collections and not isinstance(value, list):
                 value = [value]
             setattr(target, name, value)
 
@@ -118,7 +125,7 @@ class TypeMixer(BaseTypeMixer):
             return field_name, SKIP_VALUE
 
         relation = self.mapper.get_property(field_name)
-        session = self.__mixer.params.get('session')
+        session = self.__mixer.get_session()
         value = session.query(
             relation.mapper.class_
         ).filter(*select.choices).order_by(func.random()).first()
@@ -168,7 +175,8 @@ class TypeMixer(BaseTypeMixer):
 
         """
         field = self.__fields.get(field_name)
-        if field and isinstance(field.scheme, RelationshipProperty):
+        if field and isinstance(field.scheme, RelationshipProperty) and \
+                field_value is not SKIP_VALUE:
             return field_name, t._Deffered(field_value, field.scheme)
 
         return super(TypeMixer, self).get_value(field_name, field_value)
@@ -217,6 +225,33 @@ class TypeMixer(BaseTypeMixer):
         return super(TypeMixer, self).make_fabric(
             stype, field_name=field_name, fake=fake, kwargs=kwargs)
 
+    def reserve(self, field):
+        """ Load values of the unique column from database.
+
+        :return tuple: (stored values, max stored value for integer columns)
+
+        """
+        column = field.scheme
+        session = self.__mixer and self.__mixer.get_session()
+        if not session or isinstance(column, RelationshipProperty):
+            return set(), None
+
+        if isinstance(column.type, Integer) and not isinstance(column.type, SmallInteger):
+            return set(), session.query(func.max(column)).scalar()
+
+        return set(value for (value,) in session.query(column)), None
+
+    def get_stored(self):
+        """ Get an instance from database.
+
+        :return: An instance or None
+
+        """
+        if not self.__mixer or not self.__mixer.params.get('session'):
+            return None
+
+        return self.__mixer.get_session().query(self.mapper).first()
+
     def guard(self, *args, **kwargs):
         """ Look objects in database.
 
@@ -224,7 +259,7 @@ class TypeMixer(BaseTypeMixer):
 
         """
         try:
-            session = self.__mixer.params.get('session')
+            session = self.__mixer.get_session()
             assert session
         except (AttributeError, AssertionError):
             raise ValueError('Cannot make request to DB.')
@@ -243,17 +278,122 @@ class TypeMixer(BaseTypeMixer):
     def reload(self, obj):
         """ Reload object from database. """
         try:
-            session = self.__mixer.params.get('session')
+            session = self.__mixer.get_session()
             session.expire(obj)
             session.refresh(obj)
             return obj
         except (AttributeError, AssertionError):
             raise ValueError('Cannot make request to DB.')
 
+    def aguard(self, *args, **kwargs):
+        """ Look objects in database with mixer's AsyncSession.
+
+        :returns: An awaitable object (or a list of objects or False)
+
+        """
+        from ._async import run_session
+        return run_session(self.__mixer.params.get('session'), self.guard, *args, **kwargs)
+
+    def areload(self, obj):
+        """ Reload object from database with mixer's AsyncSession.
+
+        :returns: An awaitable object
+
+        """
+        from ._async import run_session
+        return run_session(self.__mixer.params.get('session'), self.reload, obj)
+
+    def insert_many(self, count, tables):
+        """ Generate rows of the mapper's table and insert them with executemany.
+
+        Relations are set to random rows of the parent tables: the rows from
+        `tables` or the rows stored in database.
+
+        :param count: Number of rows
+        :param tables: A dict of rows by tables (updated with parents loaded from database)
+
+        :return list: Inserted rows (dicts by column keys)
+
+        """
+        session = self.__mixer.get_session()
+        table = self.mapper.local_table
+
+        relations = []
+        for rel in self.mapper.relationships:
+            if not any(c.foreign_keys for c in rel.local_columns):
+                continue
+
+            parent = rel.mapper.local_table
+            if parent not in tables:
+                columns = [remote for _, remote in rel.local_remote_pairs]
+                tables[parent] = [
+                    dict(zip([c.key for c in columns], row))
+                    for row in session.query(*columns)]
+
+            if not tables[parent] and not all(c.nullable for c in rel.local_columns):
+                raise ValueError('Cannot find rows of %s for %s' % (
+                    parent.name, self.__scheme.__name__))
+
+            relations.append((rel, tables[parent]))
+
+        # Autoincremented keys are taken from the insert
+        autoincrement, pk = None, list(table.primary_key.columns)
+        if len(pk) == 1 and pk[0].autoincrement in (True, 'auto') and \
+                isinstance(pk[0].type, Integer):
+            autoincrement = pk[0]
+
+        rows, groups = [], dict()
+        for _ in range(count):
+            values = dict()
+            for rel, parents in relations:
+                values[rel.key] = SKIP_VALUE
+                if parents:
+                    parent = faker.random.choice(parents)
+                    for local, remote in rel.local_remote_pairs:
+                        values[self.mapper.get_property_by_column(local).key] = \
+                            parent[remote.key]
+
+            state = instance_dict(self.blend(**values))
+            row = dict(
+                (column.key, state[prop.key])
+                for prop in self.mapper.column_attrs if prop.key in state
+                for column in prop.columns if column.table is table
+            )
+            groups.setdefault(frozenset(row), []).append(row)
+            rows.append(row)
+
+        # executemany requires the same keys for the rows
+        returning = getattr(session.connection(mapper=self.mapper).dialect,
+                            'insert_executemany_returning', False)
+        for keys, group in groups.items():
+            if autoincrement is None or autoincrement.key in keys:
+                session.execute(table.insert(), group)
+
+            elif returning:
+                result = session.execute(table.insert().return_defaults(), group)
+                for row, key in zip(group, result.inserted_primary_key_rows):
+                    row[autoincrement.key] = key[0]
+
+            # The dialect returns only the key of a single row
+            else:
+                for row in group:
+                    key = session.execute(table.insert(), row).inserted_primary_key
+                    row[autoincrement.key] = key[0]
+
+        return rows
+
     def populate_target(self, values):
+        """ Populate target with values.
+
+        List relations are known from the mapper, so the attributes aren't
+        read (and lazy loaded) before they are set.
+
+        :return target:
+
+        """
         target = self.__scheme()
         for n, v in values:
-            if isinstance(getattr(target, n, None), InstrumentedList) and not isinstance(v, list):
+            if n in self.collections and not isinstance(v, list):
                 v = [v]
             setattr(target, n, v)
         return target
@@ -289,7 +429,7 @@ class Mixer(BaseMixer):
         """Initialize the SQLAlchemy Mixer.
 
         :param fake: (True) Generate fake data instead of random data.
-        :param session: SQLAlchemy session. Using for commits.
+        :param session: SQLAlchemy session (or AsyncSession). Using for commits.
         :param commit: (True) Commit instance to session after creation.
 
         """
@@ -297,6 +437,140 @@ class Mixer(BaseMixer):
         self.params['session'] = session
         self.params['commit'] = bool(session) and commit
 
+    def get_session(self):
+        """ Get a session for blocking requests.
+
+        The sync session of an AsyncSession works only inside of
+        `AsyncSession.run_sync` (see :meth:`Mixer.ablend`), other
+        requests raise ValueError.
+
+        :return Session:
+
+        """
+        session = self.params.get('session')
+        sync_session = getattr(session, 'sync_session', None)
+        if sync_session is None:
+            return session
+
+        if not ASYNC.get():
+            raise ValueError(
+                'AsyncSession is supported only by "ablend", "aguard" and "areload".')
+
+        return sync_session
+
+    def populate(self, counts):
+        """ Generate a lot of objects for a few models and insert them in bulk.
+
+        Models are ordered by their tables' foreign keys (`metadata.sorted_tables`),
+        rows of each model are generated at once and inserted with executemany.
+        Relations are set to random parents: the rows generated by the call or
+        stored in database. Objects are not added to the session and the
+        transaction is committed once.
+
+        ::
+
+            mixer.populate({User: 1000, Role: 50000})
+
+        :param counts: A dict of models (or their paths) and numbers of objects
+
+        :return dict: Inserted rows by models
+
+        """
+        session = self.get_session()
+        if not session:
+            raise ValueError('Cannot make request to DB.')
+
+        mixers = [self.get_typemixer(model) for model in counts]
+
+        def order(type_mixer):
+            table = type_mixer.mapper.local_table
+            return table.metadata.sorted_tables.index(table)
+
+        tables, result = dict(), dict()
+        with self.ctx(commit=False):
+            for type_mixer, count in sorted(
+                    zip(mixers, counts.values()), key=lambda pair: order(pair[0])):
+                rows = type_mixer.insert_many(count, tables)
+                tables[type_mixer.mapper.local_table] = rows
+                result[type_mixer.mapper.class_] = rows
+
+        session.commit()
+        return result
+
+    def stream(self, scheme, count, chunk_size=1000, pks=False, **values):
+        """ Generate objects by chunks and remove them from the session.
+
+        Every chunk is committed and the session is cleared with
+        `session.expunge_all()` (so the objects loaded by other code are
+        removed too), the memory doesn't depend on `count`.
+
+        ::
+
+            for users in mixer.stream(User, 10 ** 6, pks=True):
+                print(users)  # [1, 2, 3, ...]
+
+        :param scheme: Model for generation
+        :param count: Number of objects
+        :param chunk_size: (1000) Number of objects per commit
+        :param pks: (False) Yield primary keys instead of objects
+        :param values: Predefined fields
+
+        :return: A generator of lists of objects (or primary keys)
+
+        """
+        session = self.get_session()
+        if not session:
+            raise ValueError('Cannot make request to DB.')
+
+        while count > 0:
+            with self.ctx(commit=False):
+                chunk = [self.blend(scheme, **values) for _ in range(min(count, chunk_size))]
+
+            count -= len(chunk)
+            session.add_all(chunk)
+            session.flush()
+            if pks:
+                chunk = [inspect(obj).identity for obj in chunk]
+                chunk = [key[0] if len(key) == 1 else key for key in chunk]
+
+            # Detached objects keep their loaded values after the commit
+            session.expunge_all()
+            session.commit()
+            yield chunk
+
+    def ablend(self, scheme, **values):
+        """ Generate instance of `scheme` with an AsyncSession.
+
+        Generated objects are added to the session and committed once per
+        call, so use `mixer.cycle(count).ablend` to generate a batch.
+        Initialize the session with `expire_on_commit=False` to read
+        the objects' attributes after the commit.
+
+        ::
+
+            mixer = Mixer(session=async_session)
+
+            user = await mixer.ablend(User)
+            users = await mixer.cycle(100).ablend(User)
+
+        :return: An awaitable instance
+
+        """
+        return self._ablend(scheme, None, None, **values)
+
+    def _ablend(self, scheme, count, guards, **values):
+        from ._async import ablend_session
+        return ablend_session(self, scheme, count, guards, **values)
+
+    def areload(self, *objs):
+        """ Reload the objects from database with an AsyncSession.
+
+        :return: An awaitable object or list of objects
+
+        """
+        from ._async import run_session
+        return run_session(self.params.get('session'), self.reload, *objs)
+
     def postprocess(self, target):
         """ Save objects in db.
 
@@ -309,12 +583,15 @@ class Mixer(BaseMixer):
                 LOGGER.warning("'commit' set true but session not initialized.")
             else:
                 session.add(target)
-                session.commit()
+
+                # AsyncSession is committed once per `ablend` call
+                if session is self.get_session():
+                    session.commit()
 
         return target
 
 
 # Default mixer
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 # pylama:ignore=E1120,E0611
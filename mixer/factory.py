@@ -5,7 +5,7 @@ import decimal
 import inspect
 
 from . import _compat as _, mix_types as t
-from ._faker import faker
+from ._faker import LazyMethod, faker
 
 
 class GenFactoryMeta(type):
@@ -180,4 +180,7 @@ class GenFactory(_.with_metaclass(GenFactoryMeta)):
         if func is None:
             return False
 
+        if isinstance(func, LazyMethod):
+            return func.resolve()
+
         return func
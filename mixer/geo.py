@@ -0,0 +1,146 @@
+""" Generate GeoJSON data.
+
+mixer.geo
+~~~~~~~~~
+
+The module generates valid GeoJSON geometries (Point, LineString and Polygon)
+in bulk. Coordinates are floats in GeoJSON order (longitude, latitude).
+
+::
+
+    from mixer.geo import GeoGenerator
+
+    geo = GeoGenerator(bbox=(30.1, 59.8, 30.6, 60.1), clusters=5, spread=0.01)
+    points = geo.points(10 ** 6)
+
+"""
+from __future__ import absolute_import, division
+
+import math
+
+from ._faker import faker
+
+
+# A bounding box in GeoJSON order: (west, south, east, north)
+WORLD = (-180.0, -90.0, 180.0, 90.0)
+
+
+class GeoGenerator(object):
+
+    """ Generate coordinates and geometries inside of a bounding box.
+
+    :param bbox: (WORLD) A bounding box (west, south, east, north)
+    :param clusters: (None) Number of clusters, coordinates are distributed
+                     normally around random centers instead of uniformly
+    :param spread: (1.0) Standard deviation of the clusters and the maximum
+                   radius of polygons in degrees
+    :param random: (faker.random) A `random.Random` instance
+
+    """
+
+    def __init__(self, bbox=WORLD, clusters=None, spread=1.0, random=None):
+        west, south, east, north = bbox
+        if west >= east or south >= north:
+            raise ValueError('Invalid bounding box: %s' % (bbox,))
+
+        self.bbox = bbox
+        self.spread = spread
+        self.random = random
+        self.centers = clusters and self.__uniform(clusters)
+
+    def __uniform(self, count):
+        west, south, east, north = self.bbox
+        uniform = (self.random or faker.random).uniform
+        return [[uniform(west, east), uniform(south, north)] for _ in range(count)]
+
+    def __clustered(self, count):
+        west, south, east, north = self.bbox
+        random = self.random or faker.random
+        choice, gauss, spread, centers = random.choice, random.gauss, self.spread, self.centers
+        coordinates = []
+        for _ in range(count):
+            lon, lat = choice(centers)
+            coordinates.append([
+                min(max(gauss(lon, spread), west), east),
+                min(max(gauss(lat, spread), south), north),
+            ])
+        return coordinates
+
+    def coordinates(self, count):
+        """ Generate a list of positions ([longitude, latitude]).
+
+        :return list:
+
+        """
+        if self.centers:
+            return self.__clustered(count)
+        return self.__uniform(count)
+
+    def point(self):
+        """ Generate a Point.
+
+        :return dict:
+
+        """
+        return dict(type='Point', coordinates=self.coordinates(1)[0])
+
+    def points(self, count):
+        """ Generate a list of Points.
+
+        :return list:
+
+        """
+        return [dict(type='Point', coordinates=c) for c in self.coordinates(count)]
+
+    def linestring(self, length=5):
+        """ Generate a LineString.
+
+        :param length: Number of positions (2 at least)
+
+        :return dict:
+
+        """
+        return dict(type='LineString', coordinates=self.coordinates(max(length, 2)))
+
+    def polygon(self, length=5):
+        """ Generate a Polygon.
+
+        The polygon's ring goes around a random center with sorted angles,
+        so it doesn't intersect itself, and it is closed (the last position
+        is equal to the first one).
+
+        :param length: Number of vertices (3 at least)
+
+        :return dict:
+
+        """
+        west, south, east, north = self.bbox
+        random = self.random or faker.random
+        lon, lat = self.coordinates(1)[0]
+
+        # Keep the ring inside of the bounding box
+        radius = min(lon - west, east - lon, lat - south, north - lat, self.spread)
+        if radius <= 0:
+            lon, lat = (west + east) / 2, (south + north) / 2
+            radius = min(east - lon, north - lat, self.spread)
+
+        angles = sorted(random.uniform(0, 2 * math.pi) for _ in range(max(length, 3)))
+        ring = []
+        for angle in angles:
+            distance = radius * random.uniform(0.1, 1)
+            ring.append([lon + distance * math.cos(angle), lat + distance * math.sin(angle)])
+
+        ring.append(list(ring[0]))
+        return dict(type='Polygon', coordinates=[ring])
+
+    def polygons(self, count, length=5):
+        """ Generate a list of Polygons.
+
+        :return list:
+
+        """
+        return [self.polygon(length) for _ in range(count)]
+
+
+# Default generator
+geo = GeoGenerator()
@@ -15,6 +15,8 @@ import warnings
 from types import GeneratorType
 
 import logging
+import sys
+import threading
 import traceback
 from collections import defaultdict
 from contextlib import contextmanager
@@ -22,9 +24,14 @@ from copy import deepcopy
 from functools import partial
 from types import FunctionType, MethodType, BuiltinFunctionType
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
 from . import mix_types as t, _compat as _
 from .factory import GenFactory
-from ._faker import faker
+from ._faker import LazyMethod, MixerGenerator, faker
 
 
 SKIP_VALUE = object()
@@ -35,11 +42,102 @@ if not LOGGER.handlers and not LOGGER.root.handlers:
     LOGGER.addHandler(logging.StreamHandler())
 
 
+class DepthLimitError(RuntimeError):
+
+    """ A relation past `max_depth` has no instance to reuse. """
+
+
+class _Relations(threading.local):
+
+    """ Keep a state of the relations which are generated in the current thread.
+
+    `schemes` is a stack of schemes which are being generated and `instances`
+    keeps the instances generated inside the current top-level blend.
+
+    """
+
+    def __init__(self):
+        self.schemes = []
+        self.instances = dict()
+
+    @contextmanager
+    def scope(self):
+        """ Start a new relations budget for a top-level blend. """
+        schemes, instances = self.schemes, self.instances
+        self.schemes, self.instances = [], dict()
+        try:
+            yield self
+        finally:
+            self.schemes, self.instances = schemes, instances
+
+
+RELATIONS = _Relations()
+
+
+class _Params(MutableMapping):
+
+    """ Keep mixer's params.
+
+    The instance's values are defaults. Values set with :meth:`scope` are
+    seen by the current thread or task only.
+
+    """
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+        self.context = _.ContextVar('mixer_params_%d' % id(self), default=None)
+
+    def __repr__(self):
+        return repr(self.current)
+
+    @property
+    def current(self):
+        return self.context.get() or self.defaults
+
+    def __getitem__(self, key):
+        return self.current[key]
+
+    def __setitem__(self, key, value):
+        self.current[key] = value
+
+    def __delitem__(self, key):
+        del self.current[key]
+
+    def __contains__(self, key):
+        return key in self.current
+
+    def __iter__(self):
+        return iter(self.current)
+
+    def __len__(self):
+        return len(self.current)
+
+    def get(self, key, default=None):
+        return self.current.get(key, default)
+
+    @contextmanager
+    def scope(self, **params):
+        """ Redefine the params for the current thread or task. """
+        values = dict(self.current)
+        values.update(params)
+        token = self.context.set(values)
+        try:
+            yield self
+        finally:
+            self.context.reset(token)
+
+
 class TypeMixerMeta(type):
 
-    """ Cache typemixers by scheme. """
+    """ Cache typemixers by scheme.
+
+    The cache is read without locking, typemixers are created under a lock,
+    so every thread gets the same typemixer.
+
+    """
 
     mixers = dict()
+    lock = threading.RLock()
 
     def __call__(cls, cls_type, mixer=None, factory=None, fake=True):
         backup = cls_type
@@ -50,11 +148,15 @@ class TypeMixerMeta(type):
             raise ValueError('Invalid scheme: %s' % backup)
 
         key = (mixer, cls_type, fake, factory)
-        if key not in cls.mixers:
-            cls.mixers[key] = super(TypeMixerMeta, cls).__call__(
-                cls_type, mixer=mixer, factory=factory, fake=fake)
+        type_mixer = cls.mixers.get(key)
+        if type_mixer is None:
+            with cls.lock:
+                type_mixer = cls.mixers.get(key)
+                if type_mixer is None:
+                    type_mixer = cls.mixers[key] = super(TypeMixerMeta, cls).__call__(
+                        cls_type, mixer=mixer, factory=factory, fake=fake)
 
-        return cls.mixers[key]
+        return type_mixer
 
     @staticmethod
     def __load_cls(cls_type):
@@ -82,8 +184,13 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         self.__factory = factory or self.factory
         self.__fake = fake
         self.__gen_values = defaultdict(set)
+        self.__gen_tops = dict()
         self.__fabrics = dict()
+        self.__registered = dict()
+        self.__instances = dict()
+        self.__lock = threading.RLock()
         self.__mixer = mixer
+        self.__faker = getattr(mixer, 'faker', faker)
         self.__scheme = cls
         self.__fields = _.OrderedDict(self.__load_fields())
 
@@ -97,6 +204,63 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         :return value: a generated value
 
         """
+        schemes = RELATIONS.schemes
+
+        # Don't share instances created with another commit/export state
+        key = self.__scheme, self.__mixer and tuple(
+            self.__mixer.params.get(name) for name in ('commit', 'export'))
+
+        if schemes and not values:
+            if self.__scheme in schemes:
+                instance = RELATIONS.instances.get(key)
+                if instance is not None:
+                    return instance
+
+                LOGGER.info('Cyclic relation has been cut: %s', ' -> '.join(
+                    s.__name__ for s in schemes + [self.__scheme]))
+                return None
+
+            depth = self.__mixer and self.__mixer.params.get('max_depth')
+            if depth is not None and len(schemes) > depth:
+                return self.__reuse(key, depth)
+
+        schemes.append(self.__scheme)
+        try:
+            target = self.__blend(values)
+        finally:
+            schemes.pop()
+
+        # Relations generated with custom values aren't reused
+        if not (schemes and values):
+            self.__instances[key] = target
+
+        if schemes:
+            RELATIONS.instances[key] = target
+        else:
+            RELATIONS.instances.clear()
+
+        return target
+
+    def __reuse(self, key, depth):
+        """ Get an instance for a relation past the depth limit.
+
+        The last generated instance (with the same commit/export state)
+        or an instance from storage is used.
+
+        """
+        instance = self.__instances.get(key)
+        if instance is None:
+            instance = self.get_stored()
+
+        if instance is None:
+            raise DepthLimitError(
+                'Relations depth limit (%s) has been reached for %s. Generate or store '
+                'an instance of it first.' % (depth, self.__scheme.__name__))
+
+        return instance
+
+    def __blend(self, values):
+        """ Generate a new object. """
         defaults = deepcopy(self.__fields)
 
         # Prepare relations
@@ -241,15 +405,37 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             value = fab()
         except ValueError:
             value = None
+        except DepthLimitError:
+            raise
         except Exception as exc:
             LOGGER.exception(exc)
             raise ValueError("Generation for %s (%s) has been stopped. Exception: %s" % (
                 field_name, self.__scheme.__name__, exc))
 
         if unique and value is not SKIP_VALUE:
+            value = self.__reserve_value(field_name, field, fab, value)
+
+        return self.get_value(field_name, value)
+
+    def __reserve_value(self, field_name, field, fab, value):
+        """ Get a unique value for the field and reserve it atomically. """
+        with self.__lock:
+            if field_name not in self.__gen_tops and \
+                    self.__mixer and self.__mixer.params.get('reserve_unique'):
+                values, self.__gen_tops[field_name] = self.reserve(field)
+                self.__gen_values[field_name].update(values)
+
+            top = self.__gen_tops.get(field_name)
             counter = 0
             try:
-                while value in self.__gen_values[field_name]:
+                while True:
+                    if top is not None and value <= top:
+                        top = self.__gen_tops[field_name] = top + 1
+                        value = top
+
+                    if value not in self.__gen_values[field_name]:
+                        break
+
                     value = fab()
                     counter += 1
                     if counter > 100:
@@ -258,7 +444,7 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             except TypeError:
                 pass
 
-        return self.get_value(field_name, value)
+        return value
 
     def get_fabric(self, field, field_name=None, fake=None):
         """ Get an objects fabric for field and cache it.
@@ -276,12 +462,18 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         if field.params:
             return self.make_fabric(field.scheme, field_name, fake, kwargs=field.params)
 
-        key = (field.scheme, field_name, fake)
+        # Fabrics are bound to the methods of the current locale
+        key = (field.scheme, field_name, fake, self.__faker.get_env())
+
+        fabric = self.__fabrics.get(key)
+        if fabric is None:
+            fabric = self.__registered.get(key[:3]) or \
+                self.make_fabric(field.scheme, field_name, fake)
 
-        if key not in self.__fabrics:
-            self.__fabrics[key] = self.make_fabric(field.scheme, field_name, fake)
+            # Threads could make a fabric concurrently, but all of them use the first one
+            fabric = self.__fabrics.setdefault(key, fabric)
 
-        return self.__fabrics[key]
+        return fabric
 
     def make_fabric(self, scheme, field_name=None, fake=None, kwargs=None): # noqa
         """ Make a fabric for scheme.
@@ -300,6 +492,9 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
             return partial(type(self)(scheme, mixer=self.__mixer, fake=self.__fake,
                                       factory=self.__factory).blend, **kwargs)
 
+        # Generate values in the mixer's locale
+        fab = self.__faker.localize(fab)
+
         if kwargs:
             return partial(fab, **kwargs)
 
@@ -334,11 +529,17 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         if not field:
             return False
 
+        if not isinstance(func, (FunctionType, MethodType, LazyMethod)):
+            value = func
+            func = lambda: value
+
         key = (field.scheme, field_name, fake)
-        self.__fabrics[key] = func
+        self.__registered[key] = func
 
-        if not isinstance(func, (FunctionType, MethodType)):
-            self.__fabrics[key] = lambda: func
+        # Drop the fabrics which have been made for the field in any locale
+        for fkey in list(self.__fabrics):
+            if fkey[:3] == key:
+                self.__fabrics.pop(fkey, None)
 
     @staticmethod
     def is_unique(field):
@@ -367,6 +568,25 @@ class TypeMixer(_.with_metaclass(TypeMixerMeta)):
         """
         return SKIP_VALUE
 
+    @staticmethod
+    def reserve(field):
+        """ Load values of the unique field which are already stored.
+
+        :return tuple: A set of stored values and the max stored value for
+                       integer fields (new values will be allocated above it)
+
+        """
+        return set(), None
+
+    @staticmethod
+    def get_stored():
+        """ Get an instance of the scheme from storage.
+
+        :return: An instance or None
+
+        """
+        return None
+
     @staticmethod
     def guard(*args, **kwargs):
         """ Look in storage.
@@ -410,16 +630,23 @@ class ProxyMixer:
         :returns: A list of generated objects.
 
         """
-        result = []
-
         if self.guards:
             return self.mixer._guard(scheme, self.guards, **values) # noqa
 
-        for _ in range(self.count):
-            result.append(
-                self.mixer.blend(scheme, **values)
-            )
-        return result
+        return self.mixer._cycle(scheme, self.count, **values) # noqa
+
+    def ablend(self, scheme, **values):
+        """ Call :meth:`Mixer.ablend` a few times (for backends with asyncio support).
+
+        ::
+
+            users = await mixer.cycle(5).ablend(User)
+            user = await mixer.guard(username='mike').ablend(User, username='mike')
+
+        :returns: An awaitable list of generated objects.
+
+        """
+        return self.mixer._ablend(scheme, self.count, self.guards, **values) # noqa
 
     def __getattr__(self, name):
         raise AttributeError('Use "cycle" only for "blend"')
@@ -470,10 +697,20 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         :param silence: (False) Don't raise any errors if creation was falsed
         :param factory: (:class:`~mixer.main.GenFactory`) A class for
                           generation values for types
+        :param max_depth: (None) Limit the depth of generated relations.
+                          Deeper relations reuse the last generated instance
+                          of the same scheme or an instance from storage
+                          (:class:`DepthLimitError` is raised if there is none).
+        :param reserve_unique: (False) Load values of unique fields from
+                               storage once, so generated values don't
+                               collide with stored ones.
+        :param locale: Locale of the mixer's fake data. Every mixer has
+                       its own generator (`mixer.faker`), so mixers with
+                       different locales don't affect each other.
 
         """
-        self.params = params
-        self.faker = faker
+        self.params = _Params(params)
+        self.faker = MixerGenerator(locale=locale)
         self.__init_params__(fake=fake, loglevel=loglevel, silence=silence, locale=locale)
         self.__factory = factory or self.type_mixer_cls.factory
 
@@ -537,8 +774,8 @@ class Mixer(_.with_metaclass(_MetaMixer)):
     def __init_params__(self, locale=None, **params):
         self.params.update(params)
         if locale:
-            faker.locale = locale
-            self.params['locale'] = faker.locale
+            self.faker.locale = locale
+            self.params['locale'] = self.faker.locale
         LOGGER.setLevel(self.params.get('loglevel'))
 
     def __repr__(self):
@@ -565,7 +802,9 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         """
         type_mixer = self.get_typemixer(scheme)
         try:
-            return type_mixer.blend(**values)
+            # Values generated by user's callables get their own relations budget
+            with RELATIONS.scope():
+                return type_mixer.blend(**values)
         except Exception as e:
             if self.params.get('silence'):
                 return None
@@ -757,9 +996,12 @@ class Mixer(_.with_metaclass(_MetaMixer)):
                 type_mixer.register(field_name, func, fake=False)
 
     @contextmanager
-    def ctx(self, **params):
+    def ctx(self, locale=None, **params):
         """ Redifine params for current mixer as context.
 
+        The params and the locale are redefined for the current thread or
+        task only, so a mixer could be shared between concurrent tasks.
+
         ::
 
             with mixer.ctx(commit=False):
@@ -768,14 +1010,14 @@ class Mixer(_.with_metaclass(_MetaMixer)):
                 self.assertFalse(Hole.objects.count())
 
         """
-        _params = dict((k, v) for k, v in self.params.items() if k in params)
-        _params['locale'] = self.faker.locale
+        loglevel = LOGGER.level
 
         try:
-            self.__init_params__(**params)
-            yield self
+            with self.params.scope(**params), self.faker.use(locale):
+                LOGGER.setLevel(self.params.get('loglevel'))
+                yield self
         finally:
-            self.__init_params__(**_params)
+            LOGGER.setLevel(loglevel)
 
     def reload(self, *objs):
         """ Reload the objects from storage. """
@@ -795,6 +1037,13 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         """
         return ProxyMixer(self, count=1, guards=(args, kwargs))
 
+    def _ablend(self, scheme, count, guards, **values):
+        raise NotImplementedError(
+            '%s does not support asyncio, use "blend" instead.' % type(self).__name__)
+
+    def _cycle(self, scheme, count, **values):
+        return [self.blend(scheme, **values) for _ in range(count)]
+
     def _guard(self, scheme, guards, **values):
         type_mixer = self.get_typemixer(scheme)
         args, kwargs = guards
@@ -806,7 +1055,34 @@ class Mixer(_.with_metaclass(_MetaMixer)):
         return self.blend(scheme, **values)
 
 
+def lazy_mixer(namespace, factory):
+    """ Create a module's default mixer on the first access.
+
+    ::
+
+        # Default mixer
+        __getattr__ = lazy_mixer(globals(), Mixer)
+
+    :param namespace: The module's globals
+    :param factory: A function which creates the mixer
+
+    :return function: The module's `__getattr__` (PEP 562), python < 3.7
+                      creates the mixer at once
+
+    """
+    def __getattr__(name):
+        if name == 'mixer':
+            return namespace.setdefault('mixer', factory())
+
+        raise AttributeError('module %r has no attribute %r' % (namespace['__name__'], name))
+
+    if sys.version_info < (3, 7):
+        namespace['mixer'] = factory()
+
+    return __getattr__
+
+
 # Default mixer
-mixer = Mixer()
+__getattr__ = lazy_mixer(globals(), Mixer)
 
 # pylama:ignore=E1120
@@ -0,0 +1,5 @@
+import sys
+
+
+# Asyncio tests use the syntax and the API of Python 3.7+
+collect_ignore_glob = ['test_*_async.py'] if sys.version_info < (3, 7) else []
@@ -57,3 +57,42 @@ def test_mongoengine():
 
     users = mixer.cycle(2).blend(User)
     assert all(users)
+
+
+def test_peewee():
+    from mixer.auto import mixer
+    from .test_peewee import Person
+
+    person = mixer.blend(Person)
+    assert person.id
+
+
+def test_marshmallow():
+    from mixer.auto import mixer
+    from .test_marshmallow import Person
+
+    person = mixer.blend(Person)
+    assert person['status']
+
+    people = mixer.cycle(2).blend(Person)
+    assert len(people) == 2
+
+
+def test_registry():
+    import pytest
+    from mixer import auto
+    from mixer.auto import Backend, mixer, register
+
+    class Scheme(object):
+        name = str
+
+    with pytest.raises(ValueError):
+        mixer.blend(Scheme)
+
+    register(Backend('main', 'mixer.main.mixer', lambda scheme: scheme is Scheme))
+    try:
+        assert mixer.blend(Scheme).name
+        assert auto.BACKENDS[-1].detect(Scheme)
+    finally:
+        auto.BACKENDS.pop()
+        auto.MixerProxy.__store__.clear()
@@ -6,7 +6,8 @@ import decimal
 import pytest
 from django.core.management import call_command
 
-from .django_app.models import Rabbit, models, Hole, Door, Customer, Simple, Client, Tag, Message
+from .django_app.models import (
+    Rabbit, models, Hole, Door, Customer, Simple, Client, Tag, Message, Number)
 from mixer.backend.django import Mixer
 
 
@@ -108,6 +109,166 @@ def test_custom(mixer):
     assert user.check_password('test')
 
 
+def test_hash_password(mixer, monkeypatch):
+    from mixer.backend import django
+    from mixer.backend.django import hash_password
+
+    hashed = []
+    make_password = django.make_password
+
+    def counter(*args, **kwargs):
+        hashed.append(args)
+        return make_password(*args, **kwargs)
+
+    monkeypatch.setattr(django, 'make_password', counter)
+    middleware = mixer.middleware('auth.user')(hash_password())
+
+    user1, user2 = mixer.cycle(2).blend('auth.User')
+    assert user1.check_password('test')
+    assert user1.password == user2.password
+
+    user = mixer.blend('auth.User', password=user1.password)
+    assert user.password == user1.password
+    assert len(hashed) <= 1
+
+    mixer.unregister_middleware('auth.user', middleware)
+    mixer.middleware('auth.user')(hash_password(None))
+
+    user1 = mixer.blend('auth.User', password='other')
+    user2 = mixer.blend('auth.User', password='other')
+    assert user1.check_password('other')
+    assert user1.password == user2.password
+
+    monkeypatch.setattr(django, 'PASSWORDS_CACHE_SIZE', 2)
+
+    django.get_password('new')
+    assert len(django.PASSWORDS_CACHE) == 2
+    assert django.get_password('other') == user1.password
+
+
+def test_signals(mixer):
+    from django.db.models.signals import post_save, m2m_changed
+
+    calls = []
+
+    def receiver(sender, instance, **kwargs):
+        calls.append(instance)
+
+    post_save.connect(receiver, sender=Simple)
+    m2m_changed.connect(receiver, sender=Number.doors.through)
+    try:
+        mixer.blend(Simple)
+        assert len(calls) == 1
+
+        with mixer.ctx(signals=False):
+            mixer.blend(Simple)
+            mixer.blend('django_app.number', doors__size=42)
+        assert len(calls) == 1
+
+        with mixer.ctx(signals={post_save: [receiver]}):
+            mixer.blend(Simple)
+        assert len(calls) == 2
+
+        # The receiver is connected only for Simple
+        with mixer.ctx(signals={post_save: [receiver], m2m_changed: [receiver]}):
+            mixer.blend(Client)
+        assert len(calls) == 2
+
+        Simple.objects.create(value=1)
+        assert len(calls) == 3
+
+        with mixer.ctx(signals=False):
+            mixer.blend(Simple)
+            Simple.objects.create(value=2)
+        assert len(calls) == 4
+
+        with mixer.ctx(signals={post_save: [receiver]}):
+            simple = mixer.blend(Simple)
+            post_save.send_robust(Simple, instance=simple, created=False)
+        assert calls[-2:] == [simple, simple]
+        assert 'send' not in vars(post_save)
+
+    finally:
+        post_save.disconnect(receiver, sender=Simple)
+        m2m_changed.disconnect(receiver, sender=Number.doors.through)
+
+
+def test_files():
+    import os
+    import struct
+    from django.conf import settings
+    from mixer.backend.django import get_image
+
+    files = os.listdir(settings.TMPDIR)
+    mixer = Mixer(storage=False)
+    rabbit = mixer.blend(Rabbit)
+    assert rabbit.picture.read() == b'pylama\n'
+    assert os.listdir(settings.TMPDIR) == files
+
+    image = get_image(width=40, height=30).read()
+    assert image.startswith(b'GIF89a')
+    assert struct.unpack('<HH', image[6:10]) == (40, 30)
+
+
+def test_trusted_values(mixer, monkeypatch):
+    from mixer.backend.django import TRUSTED_TYPES
+
+    calls = []
+    to_python = models.DecimalField.to_python
+
+    def spy(field, value):
+        calls.append(value)
+        return to_python(field, value)
+
+    monkeypatch.setattr(models.DecimalField, 'to_python', spy)
+    monkeypatch.setitem(TRUSTED_TYPES, spy, decimal.Decimal)
+
+    with mixer.ctx(commit=False):
+        rabbit = mixer.blend(Rabbit)
+        assert isinstance(rabbit.speed, decimal.Decimal)
+        assert not calls
+
+        rabbit = mixer.blend(Rabbit, speed='1.5')
+        assert rabbit.speed == decimal.Decimal('1.5')
+        assert calls == ['1.5']
+
+
+def test_export(mixer, tmpdir):
+    import json
+    from django.core.management import call_command
+
+    path = str(tmpdir.join('fixture.jsonl'))
+    assert mixer.export('django_app.number', 3, path, format='jsonl', doors__size=42) == 18
+    assert not Door.objects.exists()
+
+    with open(path) as f:
+        rows = [json.loads(line) for line in f]
+
+    labels = [row['model'] for row in rows]
+    assert labels.index('django_app.rabbit') < labels.index('django_app.hole') < \
+        labels.index('django_app.door') < labels.index('django_app.number_doors')
+    assert rows[-1]['fields'] == {'number': 3, 'door': 3}
+
+    path = str(tmpdir.join('fixture.json'))
+    mixer.export(Customer, 2, path, name='test')
+    call_command('loaddata', path, verbosity=0)
+    assert Customer.objects.filter(name='test').count() == 2
+
+    mixer.export(Customer, 2, path, name='test')
+    call_command('loaddata', path, verbosity=0)
+    assert Customer.objects.filter(name='test').count() == 4
+
+    mixer.export(Customer, 1, path, pk_start=100, name='start')
+    call_command('loaddata', path, verbosity=0)
+    assert Customer.objects.get(pk=100).name == 'start'
+
+    path = str(tmpdir.join('doors.json'))
+    mixer.export('django_app.number', 2, path, doors__size=42)
+    call_command('loaddata', path, verbosity=0)
+    assert Door.objects.filter(size=42).count() == 2
+    assert Door.objects.get(pk=2).hole.owner
+
+
 def test_select(mixer):
     mixer.cycle(3).blend(Rabbit)
     hole = mixer.blend(Hole, rabbit=mixer.SELECT)
@@ -230,6 +391,18 @@ def test_invalid_scheme(mixer):
     with pytest.raises(ValueError):
         mixer.blend('django_app.Unknown')
 
+    with pytest.raises(ValueError):
+        mixer.blend('Unknown')
+
+
+def test_models_cache(mixer):
+    from mixer.backend.django import TypeMixer
+
+    assert isinstance(mixer.blend('Simple'), Simple)
+    assert isinstance(mixer.blend('django_app.simple'), Simple)
+    assert TypeMixer.models_cache['Simple'] is Simple
+    assert TypeMixer.models_cache['django_app.simple'] is Simple
+
 
 def test_skip(mixer):
     rabbit = mixer.blend(Rabbit, created_at=mixer.SKIP, title=mixer.SKIP)
@@ -250,6 +423,17 @@ def test_generic(mixer):
     assert rabbit.content_type.model_class() == Simple
 
 
+def test_generic_queries(mixer):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    mixer.blend(Rabbit)
+    with CaptureQueriesContext(connection) as ctx:
+        mixer.cycle(5).blend(Rabbit)
+
+    assert not [q for q in ctx.captured_queries if 'django_content_type' in q['sql']]
+
+
 def test_deffered(mixer):
     simples = mixer.cycle(3).blend(Simple)
     rabbits = mixer.cycle(3).blend(
@@ -267,6 +451,16 @@ def test_unique(mixer):
         mixer.blend(Client)
 
 
+def test_reserve_unique():
+    mixer = Mixer(reserve_unique=True)
+    mixer.blend(Rabbit, username='taken')
+
+    names = iter(['taken', 'taken', 'free'])
+    mixer.register(Rabbit, username=lambda: next(names))
+    rabbit = mixer.blend(Rabbit)
+    assert rabbit.username == 'free'
+
+
 def test_guard(mixer):
     r1 = mixer.guard(username='maxi').blend(Rabbit, username='maxi')
     r2 = mixer.guard(username='maxi').blend(Rabbit, username='maxi')
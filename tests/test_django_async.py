@@ -0,0 +1,40 @@
+""" Test the asyncio support of Django's backend (Python 3.7+). """
+from __future__ import absolute_import
+
+import asyncio
+
+import django
+import pytest
+
+from .django_app.models import Rabbit, Simple
+from .test_django import mixer  # noqa
+
+
+@pytest.mark.skipif(django.VERSION < (2, 2), reason='Thread sharing requires Django 2.2+')
+def test_ablend(mixer):
+    from django.db import connections
+    from mixer.backend._async import run_sync
+
+    connection = connections['default']
+    connection.inc_thread_sharing()
+
+    def share_connection():
+        connections['default'] = connection
+
+    async def main():
+        await run_sync(share_connection)
+        rabbit = await mixer.ablend(Rabbit, title='async')
+        rabbits = await mixer.cycle(3).ablend(Simple)
+        found = await mixer.guard(title='async').ablend(Rabbit, title='async')
+        assert found == rabbit
+        return rabbit, rabbits
+
+    try:
+        rabbit, simples = asyncio.run(main())
+    finally:
+        connection.dec_thread_sharing()
+
+    assert rabbit.pk
+    assert rabbit.title == 'async'
+    assert len(simples) == 3
+    assert Simple.objects.count() == 4
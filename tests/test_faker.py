@@ -35,9 +35,43 @@ def test_faker():
     faker.locale = 'en'
     assert faker.name()
     assert faker.env is env
+    assert faker.pystr is env.methods['pystr']
+    assert faker.big_integer is env.methods['big_integer']
 
     assert faker.email()
 
     assert faker.pybytes()
 
     assert faker.date_time_this_month()
+
+
+def test_uuid():
+    import uuid
+    from mixer._faker import faker
+
+    value = uuid.UUID(faker.uuid())
+    assert value.version == 4
+    assert value.variant == uuid.RFC_4122
+
+    values = faker.uuids(100, version=7, as_uuid=True)
+    assert len(set(values)) == 100
+    assert all(value.version == 7 and value.variant == uuid.RFC_4122 for value in values)
+
+    faker.seed(42)
+    values = faker.uuids(3)
+    faker.seed(42)
+    assert faker.uuids(3) == values
+    assert [str(value) for value in map(uuid.UUID, values)] == values
+
+
+def test_lazy():
+    from mixer._faker import LazyMethod, MixerGenerator
+
+    faker = MixerGenerator(locale='ru')
+    assert isinstance(faker.name, LazyMethod)
+    assert not hasattr(faker, 'no_such_method')
+
+    # Methods of the locale's providers
+    assert isinstance(faker.middle_name, LazyMethod)
+    assert faker.middle_name()
+    assert not hasattr(faker, 'no_such_method')
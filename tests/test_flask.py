@@ -131,6 +131,10 @@ def test_base():
         assert len(user.messages) == 1
         assert user.messages[0].content == 'message_content'
 
+        result = mixer.populate({Role: 20, User: 5, 'tests.test_flask.Node': 3})
+        assert Role.query.filter(Role.user_id.in_(
+            [row['id'] for row in result[User]])).count() == 20
+
 
 def test_default_mixer():
     from mixer.backend.flask import mixer
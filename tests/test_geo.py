@@ -0,0 +1,35 @@
+import pytest
+
+
+def test_geo():
+    from mixer.geo import GeoGenerator, geo
+
+    point = geo.point()
+    assert point['type'] == 'Point'
+    lon, lat = point['coordinates']
+    assert isinstance(lon, float)
+    assert -180 <= lon <= 180 and -90 <= lat <= 90
+
+    line = geo.linestring(3)
+    assert line['type'] == 'LineString'
+    assert len(line['coordinates']) == 3
+
+    with pytest.raises(ValueError):
+        GeoGenerator(bbox=(10, 10, 0, 20))
+
+    bbox = 30.1, 59.8, 30.6, 60.1
+    geo = GeoGenerator(bbox=bbox, clusters=3, spread=0.01)
+    assert len(geo.centers) == 3
+
+    points = geo.points(1000)
+    assert len(points) == 1000
+    assert all(
+        bbox[0] <= p['coordinates'][0] <= bbox[2] and bbox[1] <= p['coordinates'][1] <= bbox[3]
+        for p in points)
+
+    for polygon in geo.polygons(100, length=4):
+        ring, = polygon['coordinates']
+        assert len(ring) == 5
+        assert ring[0] == ring[-1]
+        assert len(set(map(tuple, ring))) == 4
+        assert all(bbox[0] <= lon <= bbox[2] and bbox[1] <= lat <= bbox[3] for lon, lat in ring)
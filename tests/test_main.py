@@ -1,5 +1,6 @@
 """ Test mixer base functionality. """
 import datetime
+import sys
 
 import pytest
 from decimal import Decimal
@@ -258,6 +259,152 @@ def test_locale():
     assert mixer.faker.locale == 'ru_RU'
 
 
+def test_locales_threads():
+    from threading import Thread
+    from mixer._faker import faker
+
+    class Contact:
+        phone = str
+
+    locale = faker.locale
+    ru, en = Mixer(locale='ru'), Mixer(locale='en')
+    ru.faker.warm('ru', 'it')
+    results = dict()
+
+    def run(name, mixer, locale=None):
+        with mixer.ctx(locale=locale):
+            results[name] = [mixer.blend(Contact).phone for _ in range(50)]
+
+    threads = [
+        Thread(target=run, args=('ru', ru)),
+        Thread(target=run, args=('en', en)),
+        Thread(target=run, args=('ctx', en, 'ru')),
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(phone.startswith('+7 ') for phone in results['ru'])
+    assert not any(phone.startswith('+7 ') for phone in results['en'])
+    assert all(phone.startswith('+7 ') for phone in results['ctx'])
+    assert en.faker.locale == 'en_US'
+    assert faker.locale == locale
+
+
+def test_seed_instance():
+
+    class Person:
+        name = str
+        age = int
+
+    def blend(mixer):
+        return [(p.name, p.age) for p in mixer.cycle(5).blend(Person)]
+
+    mixer = Mixer()
+    mixer.faker.seed_instance(42)
+    values = blend(mixer)
+
+    mixer.faker.seed_instance(42)
+    assert blend(mixer) == values
+
+    other = Mixer()
+    other.faker.seed_instance(42)
+    assert blend(other) == values
+
+    with mixer.ctx(locale='ru'):
+        mixer.faker.seed_instance(42)
+        ru = blend(mixer)
+        mixer.faker.seed_instance(42)
+        assert blend(mixer) == ru
+
+    assert ru != values
+
+
+@pytest.mark.skipif(sys.version_info < (3, 2), reason='threading.Barrier requires Python 3.2+')
+def test_ctx_threads():
+    from threading import Barrier, Thread
+
+    mixer = Mixer(silence=False)
+    barrier = Barrier(2, timeout=5)
+    results = dict()
+
+    def scoped():
+        with mixer.ctx(silence=True, custom=42):
+            barrier.wait()
+            results['scoped'] = mixer.params.get('silence'), mixer.params.get('custom')
+            barrier.wait()
+
+    def shared():
+        barrier.wait()
+        results['shared'] = mixer.params.get('silence'), mixer.params.get('custom')
+        barrier.wait()
+
+    threads = [Thread(target=scoped), Thread(target=shared)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert results == dict(scoped=(True, 42), shared=(False, None))
+    assert 'custom' not in mixer.params
+    assert mixer.params['silence'] is False
+
+
+@pytest.mark.skipif(sys.version_info < (3, 2), reason='threading.Barrier requires Python 3.2+')
+def test_blend_threads():
+    from threading import Barrier, Thread
+    from mixer import mix_types as mt
+    from mixer._faker import faker
+
+    class UniqueTypeMixer(TypeMixer):
+
+        @staticmethod
+        def is_unique(field):
+            return field.name == 'code'
+
+    class UniqueMixer(Mixer):
+        type_mixer_cls = UniqueTypeMixer
+
+    schemes = [type('Scheme%d' % num, (), dict(code=mt.SmallInteger, name=str))
+               for num in range(10)]
+
+    mixer = UniqueMixer()
+    threads_count = 16
+    barrier = Barrier(threads_count, timeout=10)
+    results, randoms, errors = [], [], []
+
+    def run():
+        try:
+            barrier.wait()
+            randoms.append(faker.random)
+            for num in range(100):
+                results.append(mixer.blend(schemes[num % len(schemes)]))
+        except Exception as exc:  # noqa
+            errors.append(exc)
+
+    threads = [Thread(target=run) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(results) == threads_count * 100
+    assert len(set(map(id, randoms + [faker.random]))) == threads_count + 1
+
+    for scheme in schemes:
+        codes = [obj.code for obj in results if type(obj) is scheme]
+        assert len(codes) == threads_count * 10
+        assert len(set(codes)) == len(codes)
+
+    type_mixers = [key for key in UniqueTypeMixer.mixers if key[0] is mixer]
+    assert len(type_mixers) == len(schemes)
+
+
 def test_silence():
     mixer = Mixer()
 
@@ -284,6 +431,12 @@ def test_guard():
     assert test
 
 
+def test_ablend():
+    mixer = Mixer()
+    with pytest.raises(NotImplementedError):
+        mixer.cycle(2).ablend(Test)
+
+
 def test_skip():
     mixer = Mixer()
     test = mixer.blend(Test, one=mixer.SKIP)
@@ -300,3 +453,96 @@ def test_reload():
 
     test3, test4 = mixer.reload(test, test2)
     assert test3 and test4
+
+
+def test_relation_depth():
+    from mixer.main import DepthLimitError
+
+    class Leaf:
+        value = int
+
+    class Branch:
+        leaf = Leaf
+
+    class Trunk:
+        left = Branch
+        right = Branch
+
+    mixer = Mixer(max_depth=1)
+    with pytest.raises(DepthLimitError):
+        mixer.blend(Trunk)
+
+    leaf = mixer.blend(Leaf)
+    trunk1 = mixer.blend(Trunk)
+    assert trunk1.left is not trunk1.right
+    assert trunk1.left.leaf is trunk1.right.leaf is leaf
+
+    trunk2 = mixer.blend(Trunk)
+    assert trunk2.left.leaf is leaf
+
+    trunk3 = mixer.blend(Trunk, left__leaf__value=42)
+    assert trunk3.left.leaf.value == 42
+    assert trunk3.right.leaf is not trunk3.left.leaf
+
+    trunk4 = mixer.blend(Trunk, right=lambda: mixer.blend(Branch))
+    assert trunk4.right.leaf is not trunk4.left.leaf
+
+
+def test_relation_depth_chain():
+    from collections import Counter
+
+    created = Counter()
+
+    def scheme(name, **fields):
+
+        def __init__(self):
+            created[name] += 1
+
+        fields['__init__'] = __init__
+        return type(name, (), fields)
+
+    D = scheme('D', value=int)
+    C = scheme('C', d=D)
+    B = scheme('B', c=C)
+    A = scheme('A', b=B)
+
+    mixer = Mixer(max_depth=1)
+    c = mixer.blend(C)
+    objs = [mixer.blend(A) for _ in range(3)]
+
+    assert all(obj.b.c is c for obj in objs)
+    assert created == dict(A=3, B=3, C=1, D=1)
+
+
+def test_relation_cycle():
+
+    class Node:
+        value = int
+
+    Node.parent = Node
+
+    mixer = Mixer()
+    node1 = mixer.blend(Node)
+    assert node1.parent is None
+
+    node2 = mixer.blend(Node, parent=lambda: mixer.blend(Node))
+    assert node2.parent is not None
+    assert node2.parent.parent is None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='Default mixers are lazy since python 3.7')
+def test_import_time():
+    import subprocess
+
+    code = '; '.join((
+        'import sys',
+        'import mixer.main',
+        'from mixer._faker import faker, AVAILABLE_LOCALES',
+        'assert not any(env.loaded for env in faker._envs.values())',
+        # Providers of locales aren't imported
+        "assert not [name for name in sys.modules if name.startswith('faker.providers.') and "
+        "name.rsplit('.', 1)[-1] in AVAILABLE_LOCALES]",
+        "assert 'mixer' not in vars(mixer.main)",
+        'assert mixer.main.mixer is mixer.main.mixer',
+    ))
+    subprocess.check_call([sys.executable, '-c', code])
@@ -19,6 +19,8 @@ class Pet(ma.Schema):
     animal_type = ma.fields.String(default='cat')
     owner = ma.fields.Nested(Person, many=True)
     awards = ma.fields.List(ma.fields.Str)
+    age = ma.fields.Integer(validate=ma.validate.Range(min=1, max=30))
+    nick = ma.fields.String(validate=ma.validate.Length(min=2, max=5))
 
 
 @pytest.fixture
@@ -40,3 +42,80 @@ def test_mixer(mixer):
     assert pet['animal_type'] == 'cat'
     assert pet['owner']
     assert pet['awards'] is not None
+
+
+def test_cycle(mixer):
+    type_mixer = mixer.get_typemixer(Pet)
+    assert type_mixer.schema is mixer.get_typemixer(Pet).schema
+
+    loads = []
+    load = type_mixer.schema.load
+
+    def counter(data, many=None, **kwargs):
+        loads.append(many)
+        return load(data, many=many, **kwargs)
+
+    type_mixer.schema.load = counter
+    try:
+        pets = mixer.cycle(3).blend(Pet, name='tom')
+    finally:
+        del type_mixer.schema.load
+
+    assert loads == [True]
+    assert [pet['name'] for pet in pets] == ['tom', 'tom', 'tom']
+    assert all(pet['owner'] for pet in pets)
+
+
+def test_payload(mixer):
+    import json
+
+    payload = mixer.payload(Pet, name='tom')
+    assert payload['name'] == 'tom'
+    assert 1 <= payload['age'] <= 30
+    assert 2 <= len(payload['nick']) <= 5
+    assert isinstance(payload['owner'][0]['birthday'], str)
+    assert Pet().validate(payload) == {}
+
+    payloads = mixer.payload(Person, 3)
+    assert len(payloads) == 3
+    assert all(Person().validate(p) == {} for p in payloads)
+
+    bodies = mixer.stream(Person, 2)
+    assert json.loads(next(bodies).decode('utf-8'))['status']
+    assert len(list(bodies)) == 1
+
+
+def test_range(mixer):
+
+    class Scores(ma.Schema):
+        any = ma.fields.Integer(validate=ma.validate.Range())
+        low = ma.fields.Integer(validate=ma.validate.Range(min=-10))
+        negative = ma.fields.Integer(validate=ma.validate.Range(max=-5))
+
+    scores = mixer.payload(Scores)
+    assert Scores().validate(scores) == {}
+    assert scores['negative'] <= -5
+
+
+def test_raw_threads(mixer):
+    import datetime
+    from threading import Event, Thread
+
+    type_mixer = mixer.get_typemixer(Person)
+    started, done = Event(), Event()
+
+    def raw():
+        with type_mixer.raw():
+            started.set()
+            done.wait(5)
+
+    thread = Thread(target=raw)
+    thread.start()
+    try:
+        started.wait(5)
+        person = mixer.blend(Person)
+    finally:
+        done.set()
+        thread.join()
+
+    assert isinstance(person['created'], datetime.datetime)
@@ -41,7 +41,10 @@ def test_generators():
     from mixer.backend.mongoengine import get_polygon
 
     polygon = get_polygon()
-    assert polygon['coordinates']
+    assert polygon['type'] == 'Polygon'
+    ring, = polygon['coordinates']
+    assert len(ring) == 6
+    assert ring[0] == ring[-1]
 
 
 def test_base():
@@ -77,6 +80,7 @@ def test_typemixer():
     assert '/' in post.url
     assert '-' in post.uuid
     assert 'coordinates' in post.place
+    PointField().validate(post.place)
 
 
 def test_relation():
@@ -95,4 +99,20 @@ def test_relation():
     assert bookmark.bookmark
 
 
+def test_generic_documents():
+    from mixer.backend.mongoengine import get_documents
+
+    documents = get_documents(Bookmark)
+    assert User in documents
+    assert Post in documents
+    assert Bookmark not in documents
+    assert Comment not in documents
+    assert get_documents(Bookmark) is documents
+
+    class Note(Document):
+        text = StringField()
+
+    assert Note in get_documents(Bookmark)
+
+
 # pylama:ignore=W0401,W0614
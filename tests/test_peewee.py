@@ -27,8 +27,18 @@ class Pet(Model):
         database = db
 
 
+class Ticket(Model):
+    number = IntegerField(unique=True)
+    level = IntegerField(unique=True, choices=((1, 'low'), (2, 'middle'), (3, 'high')))
+    seat = SmallIntegerField(unique=True)
+
+    class Meta:
+        database = db
+
+
 Person.create_table()
 Pet.create_table()
+Ticket.create_table()
 
 
 @pytest.fixture
@@ -41,6 +51,7 @@ def mixer():
 def clean_tables():
     Person.delete().execute()
     Pet.delete().execute()
+    Ticket.delete().execute()
 
 
 def test_mixer(mixer):
@@ -78,3 +89,15 @@ def test_select(mixer):
     person = mixer.blend(Person)
     pet = mixer.blend(Pet, owner=mixer.SELECT)
     assert person == pet.owner
+
+
+def test_reserve_unique():
+    from mixer.backend.peewee import Mixer
+
+    Ticket.create(number=10 ** 9, level=3, seat=32767)
+
+    mixer = Mixer(reserve_unique=True)
+    tickets = mixer.cycle(2).blend(Ticket)
+    assert [t.number for t in tickets] == [10 ** 9 + 1, 10 ** 9 + 2]
+    assert sorted(t.level for t in tickets) == [1, 2]
+    assert all(-32768 <= t.seat < 32767 for t in tickets)
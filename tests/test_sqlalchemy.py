@@ -70,7 +70,14 @@ class Role(BASE):
     name = Column(String(20), primary_key=True)
     user_id = Column(Integer, ForeignKey(User.id), nullable=False)
 
-    user = relation(User)
+    user = relation(User, backref='roles')
+
+
+class Ticket(BASE):
+    __tablename__ = 'ticket'
+
+    id = Column(Integer, primary_key=True)
+    number = Column(Integer, unique=True, nullable=False)
 
 
 BASE.metadata.create_all(ENGINE)
@@ -108,6 +115,12 @@ def test_typemixer():
     assert role.user
     assert role.user_id == role.user.id
 
+    mixer = TypeMixer(User)
+    assert mixer.collections == {'roles'}
+
+    user = mixer.blend(roles=role)
+    assert user.roles == [role]
+
 
 def test_mixer(session):
     from mixer.backend.sqlalchemy import Mixer
@@ -231,3 +244,93 @@ def test_postgresql():
     mixer = TypeMixer(Test)
     test = mixer.blend()
     assert test.uuid
+
+
+def test_reserve_unique(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    session.add(Ticket(number=10 ** 9))
+    session.commit()
+
+    mixer = Mixer(session=session, reserve_unique=True)
+    tickets = mixer.cycle(3).blend(Ticket)
+    assert [t.number for t in tickets] == [10 ** 9 + 1, 10 ** 9 + 2, 10 ** 9 + 3]
+
+
+def test_relation_depth(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    Mixer(session=session).blend(User)
+    stored = session.query(User).first()
+
+    mixer = Mixer(session=session, max_depth=0)
+    roles = mixer.cycle(2).blend(Role)
+    assert roles[0].user is roles[1].user is stored
+
+
+def test_populate(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    with pytest.raises(ValueError):
+        Mixer().populate({User: 2})
+
+    mixer = Mixer(session=session)
+    result = mixer.populate({Role: 30, User: 10, Profile: 3, ProfileNonIncremental: 3})
+    assert len(result[User]) == 10
+    assert len(result[Role]) == 30
+
+    profiles = set(row['id'] for row in result[Profile])
+    users = session.query(User).filter(User.id.in_([row['id'] for row in result[User]]))
+    assert users.count() == 10
+    assert all(user.profile_id in profiles for user in users)
+
+    roles = session.query(Role).filter(Role.name.in_([row['name'] for row in result[Role]]))
+    assert roles.count() == 30
+    assert all(role.user in users for role in roles)
+
+    # Parents are taken from database
+    result = mixer.populate({'tests.test_sqlalchemy.Role': 5})
+    assert len(result[Role]) == 5
+
+
+def test_populate_keys(session):
+    from sqlalchemy import event
+    from mixer.backend.sqlalchemy import Mixer
+
+    table = User.__table__
+    inserted = []
+
+    # Another writer inserts a row before the populated ones
+    def writer(conn, clause, *args):
+        if inserted or getattr(clause, 'table', None) is not table:
+            return
+        inserted.append(None)
+        inserted[0] = conn.execute(table.insert().values(
+            name='writer', enum='one', profile_id=0,
+            profile_id_nonincremental=0)).inserted_primary_key[0]
+
+    mixer = Mixer(session=session)
+    event.listen(ENGINE, 'before_execute', writer)
+    try:
+        result = mixer.populate({User: 5, Profile: 2, ProfileNonIncremental: 2})
+    finally:
+        event.remove(ENGINE, 'before_execute', writer)
+
+    assert inserted
+    assert inserted[0] not in [row['id'] for row in result[User]]
+    for row in result[User]:
+        assert session.query(User).get(row['id']).name == row['name']
+
+
+def test_stream(session):
+    from mixer.backend.sqlalchemy import Mixer
+
+    mixer = Mixer(session=session)
+    chunks = list(mixer.stream(User, 5, chunk_size=2, name='stream'))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[0][0].name == 'stream'
+    assert not session.identity_map
+
+    chunks = list(mixer.stream(Role, 3, pks=True))
+    assert len(chunks) == 1
+    assert session.query(Role).filter(Role.name.in_(chunks[0])).count() == 3
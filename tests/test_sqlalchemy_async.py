@@ -0,0 +1,76 @@
+""" Test the AsyncSession support of SQLAlchemy's backend (Python 3.7+). """
+from __future__ import absolute_import
+
+import asyncio
+
+import pytest
+
+from .test_sqlalchemy import BASE, Role, User
+
+
+pytest.importorskip('aiosqlite')
+asyncio_ext = pytest.importorskip('sqlalchemy.ext.asyncio')
+
+
+def test_async_session():
+    from mixer.backend.sqlalchemy import Mixer
+
+    async def main():
+        engine = asyncio_ext.create_async_engine('sqlite+aiosqlite://')
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(BASE.metadata.create_all)
+
+            async with asyncio_ext.AsyncSession(engine, expire_on_commit=False) as session:
+                mixer = Mixer(session=session)
+
+                role = await mixer.ablend(Role)
+                assert role.user.id
+
+                users = await mixer.cycle(3).ablend(User, name='async')
+                assert all(user.id for user in users)
+
+                found = await mixer.guard(User.name == 'async').ablend(User)
+                assert sorted(u.id for u in found) == sorted(u.id for u in users)
+
+                tm = mixer.get_typemixer(User)
+                assert await tm.aguard(User.name == 'unknown') is False
+
+                users[0].name = 'wrong'
+                user = await mixer.areload(users[0])
+                assert user.name == 'async'
+
+                with pytest.raises(ValueError):
+                    mixer.blend(User)
+
+                with pytest.raises(ValueError):
+                    mixer.reload(user)
+
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())
+
+
+def test_async_concurrent(tmpdir):
+    from mixer.backend.sqlalchemy import Mixer
+
+    async def blend(engine, num):
+        async with asyncio_ext.AsyncSession(engine, expire_on_commit=False) as session:
+            mixer = Mixer(session=session)
+            user = await mixer.guard(User.name == 'task%d' % num).ablend(User, name='task%d' % num)
+            return user.name
+
+    async def main():
+        engine = asyncio_ext.create_async_engine('sqlite+aiosqlite:///%s' % tmpdir.join('db'))
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(BASE.metadata.create_all)
+
+            names = await asyncio.gather(*[blend(engine, num) for num in range(4)])
+            assert names == ['task0', 'task1', 'task2', 'task3']
+
+        finally:
+            await engine.dispose()
+
+    asyncio.run(main())